@@ -0,0 +1,103 @@
+"""
+benchmarks/bench_log_format.py - Throughput of log formatting and suppressed debug calls
+
+Measures:
+- records per second through CustomFormatter, compared with the previous
+  implementation (datetime.now().strftime and Path(pathname).name per record)
+- cost of a debug call while the logger runs at INFO, with an eager
+  f-string message compared with lazy %-style arguments
+
+Usage:
+    python benchmarks/bench_log_format.py [--records 200000]
+"""
+import argparse
+import importlib.util
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# src/logger.py is loaded on its own, importing the src package would set up
+# the application's log handlers
+spec = importlib.util.spec_from_file_location("app_logger", PROJECT_ROOT / "src" / "logger.py")
+app_logger = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(app_logger)
+
+
+class LegacyFormatter(logging.Formatter):
+    """CustomFormatter before caching"""
+
+    def format(self, record):
+        timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+        filename = Path(record.pathname).name
+        location = f"<{filename}\t{record.funcName}: {record.lineno}>"
+        prefix = f"{timestamp}\t{location}\t"
+        return f"{prefix}{record.getMessage()}"
+
+
+def make_records(count):
+    """Records from a handful of call sites, like a real log"""
+    sites = [
+        ("/app/src/components/labels.py", "set_success", 42),
+        ("/app/src/components/drop_zone.py", "_on_drag_enter", 81),
+        ("/app/src/utils.py", "get_asset_path", 30),
+        ("/app/src/installer.py", "_extract_entry", 640),
+    ]
+    records = []
+    for i in range(count):
+        pathname, func, lineno = sites[i % len(sites)]
+        records.append(logging.LogRecord(
+            "ForestModManager.Bench", logging.DEBUG, pathname, lineno,
+            "Asset path resolved: %s", (f"/app/assets/icon_{i % 50}.png",), None, func=func
+        ))
+    return records
+
+
+def bench_formatter(formatter, records):
+    start = time.perf_counter()
+    for record in records:
+        formatter.format(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def bench_suppressed(calls):
+    logger = logging.getLogger("bench.suppressed")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    value = {"path": "/app/assets/icon.png", "size": 1234}
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.debug(f"Created Card with kwargs: {value}")
+    eager = calls / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.debug("Created Card with kwargs: %s", value)
+    lazy = calls / (time.perf_counter() - start)
+    return eager, lazy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200000, help="Records per measurement")
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    legacy = bench_formatter(LegacyFormatter(), records)
+    current = bench_formatter(app_logger.CustomFormatter(), records)
+    print(f"Python {sys.version.split()[0]}, {args.records} records")
+    print(f"Formatter   legacy  {legacy:12,.0f} records/s")
+    print(f"Formatter   cached  {current:12,.0f} records/s   ({current / legacy:.1f}x)")
+
+    eager, lazy = bench_suppressed(args.records)
+    print(f"Suppressed  f-string {eager:11,.0f} calls/s")
+    print(f"Suppressed  %-style  {lazy:11,.0f} calls/s   ({lazy / eager:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+benchmarks/bench_logger_setup.py - Startup cost of setting up module loggers
+
+Compares the shared handler set up by src.logger.setup_logger with the
+previous behaviour, where every call cleaned up the logs folder, opened
+a new log file and installed coloredlogs again.
+
+Usage:
+    python benchmarks/bench_logger_setup.py [--runs 20]
+
+Each run happens in a fresh process with HOME pointed at a temporary
+folder, so real logs are not touched and module state does not carry over.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Loggers created while the application starts
+MODULE_LOGGERS = [
+    "ForestModManager", "Utils", "I18n", "ModStore", "MetadataCache", "ModRegistry",
+    "ModInstaller", "Config", "Components", "ModList", "VersionLabel", "EasterEgg",
+    "InstallWorker", "LibraryScanner", "MainWindow", "src.components.tutorial",
+]
+
+# src/logger.py is loaded on its own: importing the src package would
+# create the application's loggers before the timed part
+LOAD_LOGGER_MODULE = '''
+import importlib.util
+spec = importlib.util.spec_from_file_location("app_logger", "src/logger.py")
+app_logger = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(app_logger)
+'''
+
+LEGACY_SETUP = LOAD_LOGGER_MODULE + '''
+import logging
+from datetime import datetime
+from pathlib import Path
+
+import coloredlogs
+
+CustomFormatter = app_logger.CustomFormatter
+LEVEL_STYLES = app_logger.LEVEL_STYLES
+
+
+def cleanup_old_logs(log_dir, max_logs=15):
+    log_files = list(log_dir.glob("*.log"))
+    if len(log_files) > max_logs:
+        log_files.sort(key=lambda x: x.stat().st_mtime)
+        for path in log_files[:len(log_files) - max_logs]:
+            path.unlink()
+
+
+def setup_logger(name="ForestModManager"):
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = []
+    log_dir = Path.home() / '.forest_mod_manager' / 'logs'
+    log_dir.mkdir(parents=True, exist_ok=True)
+    cleanup_old_logs(log_dir)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    fh = logging.FileHandler(log_dir / f"mod_manager_{timestamp}.log", encoding='utf-8')
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(CustomFormatter())
+    logger.addHandler(fh)
+    coloredlogs.install(
+        level='DEBUG', logger=logger,
+        fmt='%(asctime)s\\t<%(filename)s\\t%(funcName)s: %(lineno)d>\\t%(message)s',
+        datefmt='%d-%m-%Y %H:%M:%S', level_styles=LEVEL_STYLES
+    )
+    return logger
+'''
+
+SHARED_SETUP = LOAD_LOGGER_MODULE + '''
+setup_logger = app_logger.setup_logger
+'''
+
+MEASURE = '''
+import time
+names = {names!r}
+start = time.perf_counter()
+for name in names:
+    setup_logger(name)
+print(time.perf_counter() - start)
+'''
+
+
+def run_once(setup_code: str, home: Path) -> float:
+    """Set up all module loggers in a new process, return seconds spent"""
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+    # Import logging dependencies first, so only setup_logger calls are timed
+    code = setup_code + MEASURE.format(names=MODULE_LOGGERS)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT, env=env, check=True,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure(label: str, setup_code: str, runs: int):
+    times = []
+    with tempfile.TemporaryDirectory() as home:
+        home = Path(home)
+        # Start with a full logs folder, as on a machine used for a while
+        log_dir = home / '.forest_mod_manager' / 'logs'
+        log_dir.mkdir(parents=True)
+        for i in range(15):
+            (log_dir / f"mod_manager_old_{i:02d}.log").write_text("old run\n")
+
+        for _ in range(runs):
+            times.append(run_once(setup_code, home))
+        log_files = len(list(log_dir.glob("*.log*")))
+
+    print(f"{label:<10} median {statistics.median(times) * 1000:8.2f} ms   "
+          f"min {min(times) * 1000:8.2f} ms   log files kept: {log_files}")
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20, help="Processes started per variant")
+    args = parser.parse_args()
+
+    print(f"Setting up {len(MODULE_LOGGERS)} loggers, {args.runs} runs each")
+    legacy = measure("per-call", LEGACY_SETUP, args.runs)
+    shared = measure("shared", SHARED_SETUP, args.runs)
+    print(f"Speedup: {legacy / shared:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+benchmarks/bench_startup.py - Time to first frame of the GUI
+
+Starts the application several times with FOREST_MOD_MANAGER_STARTUP_REPORT
+set, so it writes its startup timings and quits once the first frame is
+drawn. The first run also uses python -X importtime to list the imports
+that cost the most, including everything they import.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--top 15] [--json startup.json]
+
+Needs a display (or xvfb-run on Linux). Each run uses a temporary HOME,
+so config, mods and logs of the real installation are not touched.
+Save the output with --json to compare startup between versions.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+REPORT_ENV = "FOREST_MOD_MANAGER_STARTUP_REPORT"
+PHASES = ('imports_ms', 'appearance_ms', 'window_ms', 'first_paint_ms')
+
+
+def run_once(home: Path, import_time: bool = False):
+    """Start the GUI until first frame, return its report and -X importtime output"""
+    report_path = home / "startup.json"
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+    env[REPORT_ENV] = str(report_path)
+    command = [sys.executable]
+    if import_time:
+        command += ["-X", "importtime"]
+    command += ["-m", "src.app"]
+
+    result = subprocess.run(
+        command, cwd=PROJECT_ROOT, env=env, check=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    with open(report_path, encoding='utf-8') as f:
+        return json.load(f), result.stderr
+
+
+def slowest_imports(stderr: str, top: int):
+    """
+    Parse -X importtime output.
+
+    Returns:
+        list: (cumulative microseconds, module) of top-level imports, slowest first
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented, their time is already in the parent
+        if not name[1:].startswith(" "):
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Application starts")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    reports = []
+    with tempfile.TemporaryDirectory() as home:
+        home = Path(home)
+        # First start creates config and caches, like a first launch
+        _, import_output = run_once(home, import_time=True)
+        for _ in range(args.runs):
+            reports.append(run_once(home)[0])
+
+    imports = slowest_imports(import_output, args.top)
+    summary = {
+        'version': reports[0]['version'],
+        'python': reports[0]['python'],
+        'runs': args.runs,
+        'median': {phase: statistics.median(r[phase] for r in reports) for phase in PHASES},
+        'min': {phase: min(r[phase] for r in reports) for phase in PHASES},
+        'modules_loaded': reports[-1]['modules_loaded'],
+        'slowest_imports_ms': {name: round(us / 1000, 1) for us, name in imports}
+    }
+
+    print(f"Forest Mod Manager {summary['version']}, Python {summary['python']}, {args.runs} runs")
+    for phase in PHASES:
+        print(f"{phase[:-3]:<12} median {summary['median'][phase]:8.1f} ms   min {summary['min'][phase]:8.1f} ms")
+    print(f"Modules loaded: {summary['modules_loaded']}")
+    print("Slowest imports (cumulative):")
+    for name, ms in summary['slowest_imports_ms'].items():
+        print(f"  {ms:8.1f} ms  {name}")
+
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2), encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
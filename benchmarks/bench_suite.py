@@ -0,0 +1,249 @@
+"""
+benchmarks/bench_suite.py - Hot paths of adding and installing mods
+
+Generates synthetic mod packs of configurable shape, a MODAPI folder to
+install them into, and times:
+- Config.save_mod_file (hash and store a new archive)
+- ModCard metadata reads through Config.get_mod_metadata, cold and cached
+- ModInstaller.install_mods, full and incremental with nothing changed
+- ModInstaller._clear_mods, which only renames the folder aside, deleting
+  it happens on a background thread that is not timed
+- Config.save with a registry of saved mods
+- setup_logger for new module loggers
+
+Usage:
+    python benchmarks/bench_suite.py [--shapes tiny,mixed,huge] [--shape NAME:FILES:KIB]
+                                     [--repeat 5] [--json results.json] [--compare old.json]
+
+Shapes are NAME:FILES:KIB, the number of files and their average size in
+KiB. Results are written as JSON with --json, --compare prints the change
+against such a file from another release. Everything happens under a
+temporary HOME, so config, mods and logs of the real installation are
+not touched.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SHAPES = {
+    'tiny': (5000, 1),  # Many small configs and textures
+    'mixed': (400, 64),  # Typical mod pack, sizes vary a lot
+    'huge': (4, 32 * 1024)  # A few large asset bundles
+}
+
+# Config paths are read from HOME when src is imported
+_home = tempfile.TemporaryDirectory(prefix="fmm_bench_")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _home.name
+os.environ.setdefault('FOREST_MOD_MANAGER_LOG_LEVEL', 'WARNING')
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.config import Config, CURRENT_VERSION  # noqa: E402
+from src.installer import ModInstaller, wait_for_trash  # noqa: E402
+from src.logger import setup_logger  # noqa: E402
+from src.metadata_cache import MetadataCache  # noqa: E402
+
+
+def parse_shape(text: str):
+    name, files, kib = text.split(":")
+    return name, (int(files), float(kib))
+
+
+def make_pack(path: Path, files: int, kib: float, seed: int = 0) -> int:
+    """
+    Write a ZIP mod pack in a folder tree like MODAPI mods.
+
+    File sizes vary around kib, half of the files are random bytes (like
+    compiled assemblies) and half repetitive text (like configs).
+
+    Returns:
+        int: Uncompressed size in bytes
+    """
+    rng = random.Random(seed)
+    total = 0
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for i in range(files):
+            size = max(1, int(kib * 1024 * rng.uniform(0.1, 1.9)))
+            if i % 2:
+                data = rng.getrandbits(8 * size).to_bytes(size, 'little')
+                name = f"{path.stem}/Assemblies/part{i // 100}/mod{i}.dll"
+            else:
+                line = f"setting_{i} = {rng.random()}\n".encode()
+                data = (line * (size // len(line) + 1))[:size]
+                name = f"{path.stem}/Config/part{i // 100}/mod{i}.cfg"
+            archive.writestr(name, data)
+            total += size
+    return total
+
+
+def make_modapi(root: Path) -> Path:
+    (root / "mods" / "TheForest").mkdir(parents=True)
+    return root
+
+
+def measure(repeat: int, func, setup=None) -> list:
+    """Run func repeat times, calling setup (untimed) before each run"""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        # Deleting folders left by earlier runs would slow this one down
+        wait_for_trash()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def result(name: str, shape: str, times: list, nbytes: int = None, note: str = None) -> dict:
+    median = statistics.median(times)
+    entry = {
+        'name': name,
+        'shape': shape,
+        'runs': len(times),
+        'median_s': round(median, 6),
+        'min_s': round(min(times), 6)
+    }
+    if nbytes:
+        entry['mb_per_s'] = round(nbytes / (1024 * 1024) / median, 1) if median else None
+    if note:
+        entry['note'] = note
+    throughput = f"  {entry['mb_per_s']:8.1f} MB/s" if entry.get('mb_per_s') else ""
+    note = f"  ({note})" if note else ""
+    print(f"{name:<24} {shape:<8} median {median * 1000:10.2f} ms   min {min(times) * 1000:10.2f} ms{throughput}{note}")
+    return entry
+
+
+def bench_shape(config: Config, work: Path, shape: str, files: int, kib: float, repeat: int) -> list:
+    zip_path = work / f"{shape}.zip"
+    size = make_pack(zip_path, files, kib)
+    installer = ModInstaller(make_modapi(work / f"modapi_{shape}"))
+    workers = config.get_install_workers()
+    results = []
+
+    def forget_mod():
+        if config.get_mod_info(zip_path.name):
+            config.remove_mod_file(zip_path.name)
+
+    times = measure(repeat, lambda: config.save_mod_file(zip_path), setup=forget_mod)
+    results.append(result("save_mod_file", shape, times, zip_path.stat().st_size))
+
+    mod_info = config.get_mod_info(zip_path.name)
+    cache_file = work / f"metadata_{shape}.json"
+
+    def fresh_cache():
+        config.metadata_cache = MetadataCache(cache_file)
+
+    times = measure(repeat, lambda: config.get_mod_metadata(mod_info), setup=fresh_cache)
+    results.append(result("metadata_cold", shape, times))
+    times = measure(repeat, lambda: config.get_mod_metadata(mod_info))
+    results.append(result("metadata_cached", shape, times))
+
+    def install(incremental):
+        return lambda: installer.install_mods(zip_path, incremental=incremental, workers=workers)
+
+    times = measure(repeat, install(False))
+    results.append(result("install_mods_full", shape, times, size))
+    times = measure(repeat, install(True))
+    results.append(result("install_mods_unchanged", shape, times, size))
+
+    times = measure(repeat, installer._clear_mods, setup=install(False))
+    results.append(result("clear_mods", shape, times, note="rename only, deleted in background"))
+
+    forget_mod()
+    return results
+
+
+def bench_config_save(config: Config, saved_mods: int, repeat: int) -> dict:
+    for i in range(saved_mods):
+        config.mods.put({
+            'filename': f"synthetic_{i}.zip", 'hash': f"{i:064x}", 'storage': 'archive',
+            'source': f"/downloads/synthetic_{i}.zip", 'size': 1024, 'mtime': 0,
+            'added': '2024-01-01T00:00:00', 'install_count': 0
+        })
+    config.flush()
+
+    # Write on every save, as the debounce would otherwise hide the cost
+    save_delay, config.save_delay = config.save_delay, 0
+    try:
+        times = measure(repeat, config.save)
+    finally:
+        config.save_delay = save_delay
+    return result("config_save", f"{saved_mods}mods", times)
+
+
+def bench_setup_logger(count: int, repeat: int) -> dict:
+    runs = iter(range(repeat))
+
+    def create_loggers():
+        run = next(runs)
+        for i in range(count):
+            setup_logger(f"Bench{run}_{i}")
+
+    return result("setup_logger", f"{count}x", measure(repeat, create_loggers))
+
+
+def compare(results: list, old_path: Path):
+    with open(old_path, encoding='utf-8') as f:
+        old = json.load(f)
+    old_results = {(r['name'], r['shape']): r for r in old['results']}
+    print(f"\nCompared with {old['version']} ({old_path.name}), median time, lower is better:")
+    for entry in results:
+        before = old_results.get((entry['name'], entry['shape']))
+        if before and before['median_s']:
+            change = entry['median_s'] / before['median_s']
+            print(f"{entry['name']:<24} {entry['shape']:<8} {change:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shapes", default=",".join(SHAPES), help="Built-in shapes to run")
+    parser.add_argument("--shape", action="append", type=parse_shape, default=[],
+                        metavar="NAME:FILES:KIB", help="Extra shape, can be repeated")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    parser.add_argument("--saved-mods", type=int, default=500, help="Registry size for config_save")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    parser.add_argument("--compare", type=Path, help="Results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    shapes = {name: SHAPES[name] for name in args.shapes.split(",") if name}
+    shapes.update(args.shape)
+
+    print(f"Forest Mod Manager {CURRENT_VERSION}, Python {platform.python_version()}, "
+          f"{platform.system()}, {os.cpu_count()} CPUs")
+    config = Config()
+    results = []
+    with tempfile.TemporaryDirectory(dir=_home.name) as work:
+        for shape, (files, kib) in shapes.items():
+            results += bench_shape(config, Path(work), shape, files, kib, args.repeat)
+        wait_for_trash()
+    results.append(bench_config_save(config, args.saved_mods, args.repeat))
+    results.append(bench_setup_logger(100, args.repeat))
+
+    if args.json:
+        report = {
+            'version': CURRENT_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'shapes': {name: {'files': files, 'kib': kib} for name, (files, kib) in shapes.items()},
+            'results': results
+        }
+        args.json.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
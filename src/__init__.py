@@ -1,13 +1,29 @@
 # src/__init__.py
-from .config import Config
-from .i18n import _, set_language
-from .installer import ModInstaller
-from .logger import setup_logger
-
-__all__ = [
-    'setup_logger',
-    'Config',
-    'ModInstaller',
-    '_',
-    'set_language'
-]
+"""
+Exports are imported on first access (PEP 562), so python -m src can set
+up console logging before config, i18n and the installer are loaded.
+"""
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'setup_logger': '.logger',
+    'Config': '.config',
+    'ModInstaller': '.installer',
+    '_': '.i18n',
+    'set_language': '.i18n'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,16 @@
+"""
+src/__main__.py - Entry point for python -m src
+"""
+import logging
+import sys
+
+from .logger import set_console_level
+
+# Commands only print warnings unless --verbose is given. Set before .cli is
+# imported, as config, i18n and the installer log while they load.
+if len(sys.argv) > 1 and not {'-v', '--verbose'} & set(sys.argv[1:]):
+    set_console_level(logging.WARNING)
+
+from .cli import main  # noqa: E402
+
+sys.exit(main())
@@ -1,16 +1,34 @@
 """
 src/app.py - Application entry point
 """
+import time
+
+_START = time.perf_counter()  # Taken before the GUI toolkit is imported
+
+import json
 import os
+import sys
 
 import customtkinter as ctk
 
 from src.components.ui.main_window import MainWindow
+from src.config import CURRENT_VERSION
 from src.logger import setup_logger
 from src.utils import get_asset_path
 
 logger = setup_logger()
 
+_IMPORTED = time.perf_counter()
+
+# Set to a file path to write startup timings there as JSON and quit once
+# the first frame is drawn (see benchmarks/bench_startup.py)
+STARTUP_REPORT_ENV = "FOREST_MOD_MANAGER_STARTUP_REPORT"
+
+# Fonts used by the first frame, the others are loaded where they are needed
+FONTS = [
+    "assets/fonts/Roboto/Roboto-Regular.ttf"
+]
+
 
 def setup_appearance():
     """Configure application appearance"""
@@ -18,26 +36,53 @@ def setup_appearance():
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
 
-    # Load fonts
-    fonts = [
-        "assets/fonts/Roboto/Roboto-Regular.ttf",
-        "assets/fonts/IndieFlower-Regular.ttf"
-    ]
-
-    for font_path in fonts:
+    for font_path in FONTS:
         full_path = get_asset_path(font_path)
         if os.path.exists(full_path):
-            logger.debug(f"Loading font: {full_path}")
+            logger.debug("Loading font: %s", full_path)
             ctk.FontManager.load_font(full_path)
         else:
             logger.warning(f"Font not found at: {full_path}")
 
 
+def _milliseconds(since: float, until: float) -> float:
+    return round((until - since) * 1000, 1)
+
+
+def _on_first_paint(app, timings: dict):
+    """Log time to first frame, write the startup report if requested"""
+    app.update_idletasks()
+    timings['first_paint'] = time.perf_counter()
+
+    report = {
+        'version': CURRENT_VERSION,
+        'python': sys.version.split()[0],
+        'imports_ms': _milliseconds(_START, _IMPORTED),
+        'appearance_ms': _milliseconds(_IMPORTED, timings['appearance']),
+        'window_ms': _milliseconds(timings['appearance'], timings['window']),
+        'first_paint_ms': _milliseconds(_START, timings['first_paint']),
+        'modules_loaded': len(sys.modules)
+    }
+    logger.info(f"First frame drawn after {report['first_paint_ms']} ms "
+                f"(imports {report['imports_ms']} ms, window {report['window_ms']} ms)")
+
+    report_path = os.environ.get(STARTUP_REPORT_ENV)
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        app.destroy()
+
+
 def main():
     try:
         logger.info("Starting Forest Mod Manager")
+        timings = {}
         setup_appearance()
+        timings['appearance'] = time.perf_counter()
         app = MainWindow()
+        timings['window'] = time.perf_counter()
+        # Runs once the window's pending redraws are done
+        app.after_idle(_on_first_paint, app, timings)
         app.mainloop()
     except Exception as e:
         logger.error(f"Application crashed: {str(e)}", exc_info=True)
@@ -45,4 +90,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,251 @@
+"""
+src/cli.py - Command line interface for scripted mod management
+
+Usage:
+    python -m src add PATH [PATH ...]      Save ZIP files (or all ZIPs in folders)
+    python -m src list [--json]            Show saved mods
+    python -m src install NAME|ZIP         Install a saved mod or a ZIP file
+    python -m src verify                   Check installed files against the manifest
+    python -m src remove NAME [NAME ...]   Delete saved mods
+
+Without a command the GUI is started. This module must not import any
+GUI code (tkinter, customtkinter, PIL, tkinterdnd2), so commands start fast
+on machines without a display.
+"""
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from .config import Config
+from .installer import ModInstaller, InstallCancelled, wait_for_trash
+from .logger import setup_logger, set_console_level
+
+logger = setup_logger("CLI")
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_INTERRUPTED = 130
+
+
+def _print_error(message):
+    print(f"error: {message}", file=sys.stderr)
+
+
+def _collect_zips(paths):
+    """Expand folders to the ZIP files inside them"""
+    zips = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            zips.extend(sorted(p for p in path.iterdir() if p.suffix.lower() == '.zip'))
+        else:
+            zips.append(path)
+    return zips
+
+
+def _get_installer(config, args):
+    modapi_path = args.modapi or config.modapi_path
+    if not modapi_path:
+        raise ValueError("MODAPI folder not set, pass --modapi or choose it in the GUI first")
+    installer = ModInstaller(modapi_path)
+    if not installer.verify_paths():
+        raise ValueError(f"Not a MODAPI folder (mods/TheForest missing): {modapi_path}")
+    return installer
+
+
+class _ProgressPrinter:
+    """Prints install progress on one terminal line"""
+
+    def __init__(self, stream=sys.stderr):
+        self.stream = stream
+        self.enabled = stream.isatty()
+
+    def __call__(self, progress):
+        if self.enabled:
+            self.stream.write(
+                f"\r  {int(progress.fraction * 100):3d}%  {progress.files_done}/{progress.files_total} files"
+                f"  {progress.mb_per_second:.1f} MB/s"
+            )
+            self.stream.flush()
+
+    def finish(self):
+        if self.enabled:
+            self.stream.write("\n")
+
+
+def cmd_add(config, args):
+    failed = 0
+    zips = _collect_zips(args.paths)
+    with config.batch():
+        for zip_path in zips:
+            if zip_path.suffix.lower() != '.zip' or not zip_path.is_file():
+                _print_error(f"not a ZIP file: {zip_path}")
+                failed += 1
+                continue
+            try:
+                config.save_mod_file(zip_path)
+                print(f"added {zip_path.name}")
+            except Exception as e:
+                _print_error(f"{zip_path.name}: {e}")
+                failed += 1
+    config.metadata_cache.save()
+
+    print(f"{len(zips) - failed} added, {failed} failed")
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def cmd_list(config, args):
+    mods = []
+    for mod_info in config.get_saved_mods():
+        metadata = config.get_mod_metadata(mod_info)
+        mods.append({
+            'filename': mod_info['filename'],
+            'storage': mod_info.get('storage', 'archive'),
+            'files': metadata['entry_count'] if metadata else None,
+            'size': metadata['uncompressed_size'] if metadata else None,
+            'added': mod_info.get('added'),
+            'install_count': mod_info.get('install_count', 0),
+            'hash': mod_info.get('hash')
+        })
+    config.metadata_cache.save()
+
+    if args.json:
+        print(json.dumps(mods, indent=2))
+    else:
+        for mod in mods:
+            files = mod['files'] if mod['files'] is not None else '?'
+            print(f"{mod['filename']}\t{files} files\t{mod['storage']}\t"
+                  f"added {mod['added'] or '-'}\tinstalled {mod['install_count']}x")
+        print(f"{len(mods)} saved mods")
+    return EXIT_OK
+
+
+def cmd_install(config, args):
+    installer = _get_installer(config, args)
+    options = {
+        'incremental': not args.full,
+        'workers': args.workers or config.get_install_workers(),
+        'progress_callback': _ProgressPrinter()
+    }
+
+    mod_info = config.get_mod_info(args.mod)
+    try:
+        if mod_info is not None:
+            config.install_saved_mod(installer, mod_info, **options)
+            config.record_install(mod_info['filename'])
+        else:
+            zip_path = Path(args.mod)
+            if not zip_path.is_file():
+                raise ValueError(f"no saved mod or ZIP file named {args.mod}")
+            installer.install_mods(zip_path, **options)
+    except KeyboardInterrupt:
+        # The installer stops its threads and discards the staging folder,
+        # the current mods are left untouched
+        options['progress_callback'].finish()
+        _print_error("installation interrupted")
+        return EXIT_INTERRUPTED
+    options['progress_callback'].finish()
+
+    print(f"installed {args.mod}")
+    return EXIT_OK
+
+
+def cmd_verify(config, args):
+    installer = _get_installer(config, args)
+    result = installer.verify_installation()
+    if result is None:
+        _print_error("no install manifest, nothing to verify")
+        return EXIT_FAILED
+
+    for name in result['missing']:
+        print(f"missing\t{name}")
+    for name in result['modified']:
+        print(f"modified\t{name}")
+    if result['missing'] or result['modified']:
+        print(f"{len(result['missing'])} missing, {len(result['modified'])} modified")
+        return EXIT_FAILED
+    print("installation OK")
+    return EXIT_OK
+
+
+def cmd_remove(config, args):
+    failed = 0
+    with config.batch():
+        for name in args.names:
+            if config.get_mod_info(name) is None:
+                _print_error(f"no saved mod named {name}")
+                failed += 1
+                continue
+            config.remove_mod_file(name)
+            print(f"removed {name}")
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="The Forest Mod Manager. Run without a command to open the GUI."
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print log messages")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    add = commands.add_parser("add", help="Save ZIP files, folders add every ZIP inside")
+    add.add_argument("paths", nargs="+", metavar="PATH")
+    add.set_defaults(func=cmd_add)
+
+    list_ = commands.add_parser("list", help="Show saved mods")
+    list_.add_argument("--json", action="store_true", help="Print as JSON")
+    list_.set_defaults(func=cmd_list)
+
+    install = commands.add_parser("install", help="Install a saved mod or a ZIP file")
+    install.add_argument("mod", metavar="NAME|ZIP")
+    install.add_argument("--modapi", help="MODAPI folder, defaults to the one chosen in the GUI")
+    install.add_argument("--workers", type=int, help="Extraction threads")
+    install.add_argument("--full", action="store_true", help="Extract every file, even unchanged ones")
+    install.set_defaults(func=cmd_install)
+
+    verify = commands.add_parser("verify", help="Check installed files against the manifest")
+    verify.add_argument("--modapi", help="MODAPI folder, defaults to the one chosen in the GUI")
+    verify.set_defaults(func=cmd_verify)
+
+    remove = commands.add_parser("remove", help="Delete saved mods")
+    remove.add_argument("names", nargs="+", metavar="NAME")
+    remove.set_defaults(func=cmd_remove)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Run a command.
+
+    Returns:
+        int: Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        # Imported here, so commands never load the GUI toolkit
+        from .app import main as run_gui
+        run_gui()
+        return EXIT_OK
+
+    if not args.verbose:
+        set_console_level(logging.WARNING)
+
+    logger.info(f"Running command: {args.command}")
+    config = Config()
+    try:
+        return args.func(config, args)
+    except (ValueError, InstallCancelled) as e:
+        _print_error(e)
+        return EXIT_FAILED
+    except Exception as e:
+        logger.error(f"Command {args.command} failed: {e}", exc_info=True)
+        _print_error(e)
+        return EXIT_FAILED
+    finally:
+        config.flush()
+        # Replaced mods folders are deleted on daemon threads, which would
+        # be stopped halfway when the process exits
+        wait_for_trash()
@@ -1,27 +1,40 @@
 # src/components/__init__.py
-from .card import Card
-from .labels import Title, Subtitle, StatusLabel
-from .buttons import GradientButton, SecondaryButton, IconButton
-from .drop_zone import FileDropZone
-from .mod_card import ModCard
-from .help_button import HelpButton
-from .version_label import VersionLabel
-from .easter_egg import AnimatedDeer
-from .tutorial import TutorialOverlay, TutorialBubble
+"""
+Widgets are imported on first access (PEP 562), so importing one component
+does not load the others, e.g. the tutorial or easter egg, at startup.
+"""
+import importlib
 
-__all__ = [
-    'Card',
-    'Title',
-    'Subtitle',
-    'StatusLabel',
-    'GradientButton',
-    'SecondaryButton',
-    'IconButton',
-    'FileDropZone',
-    'ModCard',
-    'HelpButton',
-    'VersionLabel',
-    'AnimatedDeer',
-    'TutorialOverlay',
-    'TutorialBubble'
-]
\ No newline at end of file
+# Public name -> submodule defining it
+_COMPONENTS = {
+    'Card': '.card',
+    'Title': '.labels',
+    'Subtitle': '.labels',
+    'StatusLabel': '.labels',
+    'GradientButton': '.buttons',
+    'SecondaryButton': '.buttons',
+    'IconButton': '.buttons',
+    'FileDropZone': '.drop_zone',
+    'ModCard': '.mod_card',
+    'ModListItem': '.mod_list',
+    'VirtualModList': '.mod_list',
+    'HelpButton': '.help_button',
+    'VersionLabel': '.version_label',
+    'AnimatedDeer': '.easter_egg',
+    'TutorialOverlay': '.tutorial',
+    'TutorialBubble': '.tutorial'
+}
+
+__all__ = list(_COMPONENTS)
+
+
+def __getattr__(name):
+    if name not in _COMPONENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_COMPONENTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -13,7 +13,7 @@ class GradientButton(ctk.CTkButton):
         button_kwargs = Styles.BUTTON.copy()
         button_kwargs.update(kwargs)
         super().__init__(*args, **button_kwargs)
-        logger.debug(f"Created GradientButton with kwargs: {kwargs}")
+        logger.debug("Created GradientButton with kwargs: %s", kwargs)
 
 
 class SecondaryButton(ctk.CTkButton):
@@ -23,7 +23,7 @@ class SecondaryButton(ctk.CTkButton):
         button_kwargs = Styles.BUTTON_SECONDARY.copy()
         button_kwargs.update(kwargs)
         super().__init__(*args, **button_kwargs)
-        logger.debug(f"Created SecondaryButton with kwargs: {kwargs}")
+        logger.debug("Created SecondaryButton with kwargs: %s", kwargs)
 
 
 class IconButton(ctk.CTkButton):
@@ -13,4 +13,4 @@ class Card(ctk.CTkFrame):
         frame_kwargs = Styles.FRAME.copy()
         frame_kwargs.update(kwargs)
         super().__init__(*args, **frame_kwargs)
-        logger.debug(f"Created Card with kwargs: {kwargs}")
+        logger.debug("Created Card with kwargs: %s", kwargs)
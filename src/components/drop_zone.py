@@ -1,5 +1,4 @@
 from pathlib import Path
-from tkinter import filedialog
 
 from tkdnd import DND_FILES
 
@@ -95,6 +94,8 @@ class FileDropZone(Card):
             logger.debug("Click ignored - zone inactive")
             return
 
+        from tkinter import filedialog
+
         try:
             logger.debug("Opening file dialog")
             file_path = filedialog.askopenfilename(
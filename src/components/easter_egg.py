@@ -12,6 +12,8 @@ from src.utils import get_asset_path
 
 logger = setup_logger("EasterEgg")
 
+LYRICS_FONT = "assets/fonts/IndieFlower-Regular.ttf"  # Loaded when lyrics are first shown
+
 
 class AnimatedDeer(ctk.CTkFrame):
     def __init__(self, master):
@@ -25,24 +27,14 @@ class AnimatedDeer(ctk.CTkFrame):
         self._is_expanded = False
         self._animation_running = False
 
-        # Load images
-        logger.debug("Loading deer images")
+        # Load small image, the full one is decoded on first click
+        logger.debug("Loading deer image")
         try:
-            self.small_image = ctk.CTkImage(
-                light_image=Image.open(get_asset_path("assets/icons/deer1.png")),
-                dark_image=Image.open(get_asset_path("assets/icons/deer1.png")),
-                size=(40, 40)
-            )
-
-            self.full_image = ctk.CTkImage(
-                light_image=Image.open(get_asset_path("assets/icons/deer2.png")),
-                dark_image=Image.open(get_asset_path("assets/icons/deer2.png")),
-                size=(200, 200)
-            )
-            logger.debug("Deer images loaded successfully")
+            self.small_image = self._load_image("assets/icons/deer1.png", 40)
         except Exception as e:
-            logger.error(f"Failed to load deer images: {e}")
+            logger.error(f"Failed to load deer image: {e}")
             raise
+        self.full_image = None
 
         # Image label
         self.image_label = ctk.CTkLabel(
@@ -72,7 +64,7 @@ class AnimatedDeer(ctk.CTkFrame):
 
         self._animation_running = True
         current_state = 'expanded' if self._is_expanded else 'collapsed'
-        logger.debug(f"Toggling animation, current state: {current_state}")
+        logger.debug("Toggling animation, current state: %s", current_state)
 
         if self._is_expanded:
             self._restore_original_ui()
@@ -82,6 +74,8 @@ class AnimatedDeer(ctk.CTkFrame):
             self.overlay.place(x=0, y=0, relwidth=1, relheight=1)
 
             logger.debug("Configuring large deer image")
+            if self.full_image is None:
+                self.full_image = self._load_image("assets/icons/deer2.png", 200)
             self.configure(width=200, height=200)
             self.image_label.configure(image=self.full_image)
             self.lift()
@@ -91,7 +85,12 @@ class AnimatedDeer(ctk.CTkFrame):
         self._is_expanded = not self._is_expanded
         self._animation_running = False
         new_state = 'expanded' if self._is_expanded else 'collapsed'
-        logger.debug(f"Animation completed, new state: {new_state}")
+        logger.debug("Animation completed, new state: %s", new_state)
+
+    @staticmethod
+    def _load_image(path: str, size: int) -> ctk.CTkImage:
+        image = Image.open(get_asset_path(path))
+        return ctk.CTkImage(light_image=image, dark_image=image, size=(size, size))
 
     def _restore_original_ui(self):
         """Restore original UI"""
@@ -117,6 +116,7 @@ class AnimatedDeer(ctk.CTkFrame):
         """Show song lyrics"""
         logger.debug("Showing lyrics")
         if not self.lyrics_label:
+            ctk.FontManager.load_font(get_asset_path(LYRICS_FONT))
             self.lyrics_label = ctk.CTkLabel(
                 self.master,
                 text="Bury your head\nhow can you sleep\nwhile the man that you loved\nburns at the stake",
@@ -133,5 +133,5 @@ class AnimatedDeer(ctk.CTkFrame):
     def should_appear(config) -> bool:
         chance = config.get_egg_chance()
         should_appear = random.random() < chance
-        logger.debug(f"Checking if deer should appear (chance {chance * 100}%): {should_appear}")
+        logger.debug("Checking if deer should appear (chance %s%%): %s", chance * 100, should_appear)
         return should_appear
@@ -16,7 +16,7 @@ class Title(ctk.CTkLabel):
         label_kwargs = Styles.TITLE.copy()
         label_kwargs.update(kwargs)
         super().__init__(*args, **label_kwargs)
-        logger.debug(f"Created Title with kwargs: {kwargs}")
+        logger.debug("Created Title with kwargs: %s", kwargs)
 
 
 class Subtitle(ctk.CTkLabel):
@@ -26,7 +26,7 @@ class Subtitle(ctk.CTkLabel):
         label_kwargs = Styles.SUBTITLE.copy()
         label_kwargs.update(kwargs)
         super().__init__(*args, **label_kwargs)
-        logger.debug(f"Created Subtitle with kwargs: {kwargs}")
+        logger.debug("Created Subtitle with kwargs: %s", kwargs)
 
 
 class StatusLabel(ctk.CTkLabel):
@@ -36,16 +36,16 @@ class StatusLabel(ctk.CTkLabel):
         label_kwargs = Styles.LABEL.copy()
         label_kwargs.update(kwargs)
         super().__init__(*args, **label_kwargs)
-        logger.debug(f"Created StatusLabel with kwargs: {kwargs}")
+        logger.debug("Created StatusLabel with kwargs: %s", kwargs)
 
     def set_success(self, text):
-        logger.debug(f"Setting success status: {text}")
+        logger.debug("Setting success status: %s", text)
         self.configure(text=text, text_color=Colors.SUCCESS)
 
     def set_error(self, text):
-        logger.debug(f"Setting error status: {text}")
+        logger.debug("Setting error status: %s", text)
         self.configure(text=text, text_color=Colors.ERROR)
 
     def set_warning(self, text):
-        logger.debug(f"Setting warning status: {text}")
+        logger.debug("Setting warning status: %s", text)
         self.configure(text=text, text_color=Colors.WARNING)
@@ -1,9 +1,7 @@
 """
 src/components/mod_card.py - Mod information card component
 """
-import zipfile
 from datetime import datetime
-from pathlib import Path
 
 import customtkinter as ctk
 
@@ -16,12 +14,22 @@ logger = setup_logger()
 
 
 class ModCard(Card):
-    """Card displaying information about uploaded ZIP file"""
+    """
+    Card displaying information about uploaded ZIP file.
 
-    def __init__(self, master, zip_path, on_install, on_remove, *args, **kwargs):
+    Cards are reused by the mod list: show() binds a card to another
+    mod without recreating its widgets.
+    """
+
+    def __init__(self, master, on_install, on_remove, *args, **kwargs):
+        """
+        Args:
+            on_install (callable): Called with the card when Install is clicked
+            on_remove (callable): Called with the card when Remove is clicked
+        """
         super().__init__(master, *args, **kwargs)
-        self.zip_path = Path(zip_path)
-        logger.debug(f"Creating mod card for: {zip_path}")
+        self.item = None
+        logger.debug("Creating mod card")
 
         # Content frame
         content = ctk.CTkFrame(self, fg_color="transparent")
@@ -29,42 +37,35 @@ class ModCard(Card):
         content.grid_columnconfigure(1, weight=1)
 
         # File name
-        ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             content,
-            text=self.zip_path.name,
+            text="",
             font=("Roboto", 13, "bold"),
             text_color=Colors.TEXT
-        ).grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 2))
+        )
+        self.name_label.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 2))
 
         # Info frame for date and file count
         info_frame = ctk.CTkFrame(content, fg_color="transparent")
         info_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 4))
 
         # Add date
-        now = datetime.now().strftime("%d.%m.%Y %H:%M")
-        ctk.CTkLabel(
+        self.date_label = ctk.CTkLabel(
             info_frame,
-            text=_("Added: {}").format(now),
+            text="",
             font=("Roboto", 11),
             text_color=Colors.TEXT_SECONDARY
-        ).pack(side="left", padx=(0, 15))
+        )
+        self.date_label.pack(side="left", padx=(0, 15))
 
         # File count
-        try:
-            with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-                mod_count = len(zip_ref.namelist())
-            logger.debug(f"Found {mod_count} files in ZIP")
-            mod_text = _("Files count: {}").format(mod_count)
-        except Exception as e:
-            logger.error(f"Failed to read ZIP contents: {e}")
-            mod_text = _("Cannot read ZIP contents")
-
-        ctk.CTkLabel(
+        self.count_label = ctk.CTkLabel(
             info_frame,
-            text=mod_text,
+            text="",
             font=("Roboto", 11),
             text_color=Colors.TEXT_SECONDARY
-        ).pack(side="left")
+        )
+        self.count_label.pack(side="left")
 
         # Buttons
         button_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -76,7 +77,7 @@ class ModCard(Card):
             width=90,
             height=28,
             font=("Roboto", 12),
-            command=lambda: on_install(self.zip_path)
+            command=lambda: on_install(self)
         ).pack(side="left", padx=(0, 8))
 
         SecondaryButton(
@@ -87,3 +88,38 @@ class ModCard(Card):
             font=("Roboto", 12),
             command=lambda: on_remove(self)
         ).pack(side="left")
+
+    @property
+    def filename(self):
+        """Name of the mod shown by the card"""
+        return self.item.filename if self.item else None
+
+    @property
+    def zip_path(self):
+        """Path to the stored archive of the mod shown by the card"""
+        return self.item.path if self.item else None
+
+    def show(self, item, force=False):
+        """
+        Display given mod.
+
+        Args:
+            item (ModListItem): Mod to display
+            force (bool): Update labels even if the card already shows this item
+        """
+        if item is self.item and not force:
+            return
+        self.item = item
+
+        self.name_label.configure(text=item.filename)
+
+        added = item.added or datetime.now().strftime("%d.%m.%Y %H:%M")
+        self.date_label.configure(text=_("Added: {}").format(added))
+
+        if item.loading:
+            mod_text = _("Reading mod...")
+        elif item.file_count is not None:
+            mod_text = _("Files count: {}").format(item.file_count)
+        else:
+            mod_text = _("Cannot read ZIP contents")
+        self.count_label.configure(text=mod_text)
@@ -0,0 +1,203 @@
+"""
+src/components/mod_list.py - Virtualized list of saved mods
+"""
+import math
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import customtkinter as ctk
+
+from src.logger import setup_logger
+from .mod_card import ModCard
+
+logger = setup_logger("ModList")
+
+
+@dataclass
+class ModListItem:
+    """Data shown by one row of the mod list"""
+    filename: str  # Name of the mod as added by the user
+    path: Path  # Stored archive (or file store index)
+    file_count: Optional[int] = None  # None if the archive cannot be read
+    added: Optional[str] = None  # Formatted date the mod was added
+    loading: bool = False  # Metadata not read yet
+
+
+class VirtualModList(ctk.CTkFrame):
+    """
+    Scrollable list of mods that only keeps widgets for the visible rows.
+
+    Rows have a fixed height, so the visible range follows directly from
+    the scroll offset. While scrolling, the same ModCard widgets are moved
+    and bound to other items, so the number of widgets depends on the
+    list's height, not on how many mods are saved.
+    """
+
+    ROW_HEIGHT = 96
+    ROW_GAP = 4
+    SCROLL_STEP = 40  # Pixels per mouse wheel step
+
+    def __init__(self, master, on_install, on_remove, **kwargs):
+        """
+        Args:
+            on_install (callable): Called with a ModCard when its Install is clicked
+            on_remove (callable): Called with a ModCard when its Remove is clicked
+        """
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.on_install = on_install
+        self.on_remove = on_remove
+        self.items: List[ModListItem] = []
+        self._by_filename: Dict[str, ModListItem] = {}  # Index of items, for find()
+        self._rows: List[ModCard] = []
+        self._offset = 0
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self._viewport.grid(row=0, column=0, sticky="nsew")
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self._viewport.bind("<Configure>", lambda event: self._layout())
+        # CTk widgets refuse bind_all, the window does not
+        root = self.winfo_toplevel()
+        root.bind_all("<MouseWheel>", self._on_mouse_wheel, add="+")
+        root.bind_all("<Button-4>", self._on_mouse_wheel, add="+")
+        root.bind_all("<Button-5>", self._on_mouse_wheel, add="+")
+        logger.debug("Virtual mod list created")
+
+    # Data model
+
+    def set_items(self, items: List[ModListItem]):
+        """Replace all items"""
+        self.items = list(items)
+        self._by_filename = {item.filename: item for item in self.items}
+        self._refresh()
+
+    def add_item(self, item: ModListItem):
+        """Append an item"""
+        self.items.append(item)
+        self._by_filename[item.filename] = item
+        self._refresh()
+
+    def find(self, filename: str) -> Optional[ModListItem]:
+        """Get item with given filename"""
+        return self._by_filename.get(filename)
+
+    def update_item(self, item: ModListItem):
+        """Redraw an item after its data changed"""
+        for row in self._rows:
+            if row.item is item:
+                row.show(item, force=True)
+
+    def remove_item(self, filename: str):
+        """Remove item with given filename"""
+        removed = self._by_filename.pop(filename, None)
+        if removed is None:
+            return
+        self.items = [item for item in self.items if item is not removed]
+        self._refresh()
+
+    def first_row(self) -> Optional[ModCard]:
+        """Topmost visible row widget, if any"""
+        visible = [row for row in self._rows if row.winfo_ismapped()]
+        return min(visible, key=lambda row: row.winfo_y()) if visible else None
+
+    # Layout
+
+    @property
+    def _content_height(self) -> int:
+        return len(self.items) * self.ROW_HEIGHT
+
+    def _max_offset(self) -> int:
+        return max(0, self._content_height - self._viewport.winfo_height())
+
+    def _refresh(self):
+        # Rows may show items that moved or were removed
+        for row in self._rows:
+            row.item = None
+        self._layout()
+
+    def _layout(self):
+        """Position pooled rows over the visible part of the list"""
+        height = self._viewport.winfo_height()
+        if height <= 1:
+            # Not mapped yet, <Configure> will call again
+            return
+
+        self._offset = min(max(0, self._offset), self._max_offset())
+
+        needed = math.ceil(height / self.ROW_HEIGHT) + 1
+        while len(self._rows) < needed:
+            # CTk takes the size only in the constructor, not in place()
+            row = ModCard(
+                self._viewport, self.on_install, self.on_remove,
+                height=self.ROW_HEIGHT - self.ROW_GAP
+            )
+            row.pack_propagate(False)  # Keep the fixed row height
+            self._rows.append(row)
+            logger.debug("Mod list row pool grown to %s", len(self._rows))
+
+        first = self._offset // self.ROW_HEIGHT
+        for i, row in enumerate(self._rows):
+            index = first + i
+            if index < len(self.items):
+                row.show(self.items[index])
+                row.place(x=0, y=index * self.ROW_HEIGHT - self._offset, relwidth=1)
+            else:
+                row.item = None
+                row.place_forget()
+
+        total = self._content_height
+        if total <= height:
+            self._scrollbar.set(0, 1)
+        else:
+            self._scrollbar.set(self._offset / total, (self._offset + height) / total)
+
+    # Scrolling
+
+    def _scroll_to(self, offset):
+        self._offset = int(offset)
+        self._layout()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * self._content_height)
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            step = self._viewport.winfo_height() if args[2] == "pages" else self.SCROLL_STEP
+            self._scroll_to(self._offset + amount * step)
+
+    def _on_mouse_wheel(self, event):
+        # The scrollbar handles its own mouse wheel events
+        if not self._contains(event.widget) or self._is_scrollbar(event.widget):
+            return
+
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        elif sys.platform == "darwin":
+            steps = -event.delta
+        else:
+            steps = -event.delta // 120
+        self._scroll_to(self._offset + steps * self.SCROLL_STEP)
+
+    @staticmethod
+    def _is_inside(widget, parent) -> bool:
+        """Check if widget is parent or one of its descendants"""
+        try:
+            path = str(widget)
+        except Exception:
+            return False
+        return path == str(parent) or path.startswith(str(parent) + ".")
+
+    def _contains(self, widget) -> bool:
+        return self._is_inside(widget, self)
+
+    def _is_scrollbar(self, widget) -> bool:
+        return self._is_inside(widget, self._scrollbar)
@@ -1,6 +1,5 @@
 # src/components/ui/__init__.py
 from .styles import Colors, Styles
-from .tutorial_manager import Tutorial, TutorialStep
 
 __all__ = [
     'Colors',
@@ -8,3 +7,11 @@ __all__ = [
     'Tutorial',
     'TutorialStep'
 ]
+
+
+def __getattr__(name):
+    # The tutorial is only needed when the help button is clicked
+    if name in ('Tutorial', 'TutorialStep'):
+        from . import tutorial_manager
+        return getattr(tutorial_manager, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
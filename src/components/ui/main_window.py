@@ -4,8 +4,9 @@ src/ui/main_window.py - Main application window
 import os
 import subprocess
 import sys
+import threading
+from datetime import datetime
 from pathlib import Path
-from tkinter import filedialog
 
 import customtkinter as ctk
 from PIL import Image
@@ -13,35 +14,25 @@ from tkinterdnd2 import TkinterDnD
 
 from src.components import (
     Card, GradientButton, SecondaryButton,
-    Title, Subtitle, StatusLabel, FileDropZone, ModCard, AnimatedDeer, VersionLabel, HelpButton
+    Title, Subtitle, StatusLabel, FileDropZone, ModListItem, VirtualModList,
+    VersionLabel, HelpButton
 )
-from src.config import Config, MODS_DIR
+from src.config import Config
 from src.i18n import _
 from src.i18n import set_language
-from src.installer import ModInstaller
-from src.logger import setup_logger
+from src.install_worker import InstallWorker
+from src.installer import ModInstaller, InstallCancelled
+from src.library_scanner import LibraryScanner
+from src.logger import setup_logger, get_log_file, LOG_DIR
 from src.utils import get_asset_path
 from .styles import Colors
-from .tutorial_manager import Tutorial
 
 logger = setup_logger("MainWindow")
 
 
-def get_logs_dir():
-    return Path.home() / '.forest_mod_manager' / 'logs'
-
-
-def get_latest_log():
-    logs_dir = get_logs_dir()
-    log_files = list(logs_dir.glob("*.log"))
-    if log_files:
-        return max(log_files, key=lambda x: x.stat().st_mtime)
-    return None
-
-
 def open_file_explorer(path, select_file=None):
     path = Path(path)
-    logger.debug(f"Opening file explorer: path={path}, select_file={select_file}")
+    logger.debug("Opening file explorer: path=%s, select_file=%s", path, select_file)
 
     try:
         if sys.platform == 'win32':
@@ -69,14 +60,16 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
         logger.info("Initializing main window")
         super().__init__()
         self.TkdndVersion = TkinterDnD._require(self)
-        logger.debug(f"TkinterDnD version: {self.TkdndVersion}")
+        logger.debug("TkinterDnD version: %s", self.TkdndVersion)
 
         self.config = Config()
         self.title(_("The Forest Mod Manager"))
         self.geometry("600x600")
 
         set_language(self.config.language)
-        self.mod_cards = []
+        self.install_worker = InstallWorker(self)
+        self.library_scanner = LibraryScanner(self)
+        self._cancel_install = threading.Event()
 
         self._setup_window()
         self._create_widgets()
@@ -86,6 +79,8 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
             self.drop_zone.activate()
             self._update_status()
             self._load_saved_mods()
+            # Delete old mods folders an earlier run left aside
+            ModInstaller(self.config.modapi_path).reclaim_trash()
         else:
             logger.info("No MODAPI path configured")
             self.drop_zone.deactivate()
@@ -164,7 +159,7 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
         content = Card(self)
         content.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
         content.grid_columnconfigure(0, weight=1)
-        content.grid_rowconfigure(1, weight=1)
+        content.grid_rowconfigure(3, weight=1)
 
         self.status_label = StatusLabel(
             content,
@@ -172,26 +167,51 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
         )
         self.status_label.grid(row=0, column=0, pady=20, padx=20)
 
-        self.scrollable_frame = ctk.CTkScrollableFrame(
-            content,
-            fg_color="transparent",
-            height=200
+        # Install progress, shown only while installing
+        self.progress_frame = ctk.CTkFrame(content, fg_color="transparent")
+        self.progress_frame.grid(row=1, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.progress_frame.grid_columnconfigure(0, weight=1)
+
+        self.progress_bar = ctk.CTkProgressBar(
+            self.progress_frame,
+            progress_color=Colors.PRIMARY
         )
-        self.scrollable_frame.grid(
-            row=1, column=0,
-            padx=20, pady=(0, 20),
-            sticky="nsew"
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=0, column=0, sticky="ew", padx=(0, 10))
+
+        self.cancel_button = SecondaryButton(
+            self.progress_frame,
+            text=_("Cancel"),
+            command=self._cancel_installation,
+            font=("Roboto", 11),
+            width=60,
+            height=24,
+            corner_radius=6
         )
+        self.cancel_button.grid(row=0, column=1)
+        self.progress_frame.grid_remove()
 
         self.drop_zone = FileDropZone(
-            self.scrollable_frame,
+            content,
             on_file_drop=self._handle_zip,
-            height=120
+            height=100
+        )
+        self.drop_zone.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        self.mod_list = VirtualModList(
+            content,
+            on_install=self._install_mods,
+            on_remove=self._remove_mod_card,
+            height=200
+        )
+        self.mod_list.grid(
+            row=3, column=0,
+            padx=20, pady=(0, 20),
+            sticky="nsew"
         )
-        self.drop_zone.pack(fill="x", expand=True)
 
         button_frame = ctk.CTkFrame(content, fg_color="transparent")
-        button_frame.grid(row=2, column=0, padx=20, pady=(0, 20))
+        button_frame.grid(row=4, column=0, padx=20, pady=(0, 20))
 
         main_buttons = ctk.CTkFrame(button_frame, fg_color="transparent")
         main_buttons.pack(side="left")
@@ -213,24 +233,33 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
         self.version_label = VersionLabel(self, self.config)
         self.help_button = HelpButton(self, self._show_tutorial)
 
+        # Extras are set up after the first frame is drawn
+        self.after(100, self._show_deer)
+        self.after(1000, self.version_label.check_updates)
+
+    def _show_deer(self):
+        from src.components.easter_egg import AnimatedDeer
+
         if AnimatedDeer.should_appear(self.config):
             self.deer = AnimatedDeer(self)
             logger.info("A mysterious deer has appeared")
 
-        self.after(1000, self.version_label.check_updates)
-
     def _show_tutorial(self):
+        from .tutorial_manager import Tutorial
+
         tutorial = Tutorial(self)
         tutorial.element_map = {
             "modapi_button": self.modapi_button,
             "drop_zone": self.drop_zone,
-            "mod_card": self.mod_cards[0] if self.mod_cards else self.drop_zone,
+            "mod_card": self.mod_list.first_row() or self.drop_zone,
             "language_button": self.lang_button,
             "help_button": self.help_button
         }
         tutorial.start()
 
     def _select_modapi_folder(self):
+        from tkinter import filedialog
+
         logger.info("Opening MODAPI folder selection dialog")
         folder = filedialog.askdirectory(
             title=_("Select MODAPI main folder")
@@ -259,35 +288,83 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
             return
 
         path = Path(self.config.modapi_path)
-        logger.debug(f"Updating status with path: {path}")
+        logger.debug("Updating status with path: %s", path)
         self.status_label.set_success(
             _("✓ MODAPI Folder:\n{folder_name}").format(folder_name=path.name)
         )
 
     def _load_saved_mods(self):
+        """
+        Show saved mods right away as placeholder rows, then check their
+        files on the library scanner and fill the rows in as results arrive.
+        """
         logger.info("Loading saved mods")
-        for mod_info in self.config.get_saved_mods():
-            mod_path = MODS_DIR / mod_info['filename']
-            if mod_path.exists():
-                self._add_mod_card(mod_path)
-            else:
-                logger.warning(f"Mod file not found: {mod_path}")
-                self.config.remove_mod_file(mod_info['filename'])
-
-    def _add_mod_card(self, zip_path):
-        try:
-            mod_card = ModCard(
-                self.scrollable_frame,
-                zip_path,
-                on_install=self._install_mods,
-                on_remove=self._remove_mod_card
+        saved_mods = list(self.config.get_saved_mods())
+        self.mod_list.set_items([
+            ModListItem(
+                filename=mod_info['filename'],
+                path=self.config.get_mod_path(mod_info),
+                added=self._format_added(mod_info),
+                loading=True
             )
-            mod_card.pack(fill="x", padx=3, pady=2)
-            self.mod_cards.append(mod_card)
-            return mod_card
-        except Exception as e:
-            logger.error(f"Failed to create mod card: {e}", exc_info=True)
+            for mod_info in saved_mods
+        ])
+        self.library_scanner.scan(
+            saved_mods,
+            self._scan_saved_mod,
+            on_result=self._on_saved_mod_scanned,
+            on_done=self._on_saved_mods_loaded
+        )
+
+    def _scan_saved_mod(self, mod_info):
+        """
+        Runs on a scanner thread.
+
+        Returns:
+            tuple: (exists, metadata) of the mod's stored file
+        """
+        if not self.config.get_mod_path(mod_info).exists():
+            return False, None
+        return True, self.config.get_mod_metadata(mod_info)
+
+    def _on_saved_mod_scanned(self, mod_info, result):
+        item = self.mod_list.find(mod_info['filename'])
+        if item is None or item.path != self.config.get_mod_path(mod_info):
+            # Removed or replaced while the scan was running
+            return
+
+        exists, metadata = result or (True, None)
+        if not exists:
+            logger.warning(f"Mod file not found: {item.path}")
+            self.config.remove_mod_file(item.filename)
+            self.mod_list.remove_item(item.filename)
+            return
+
+        item.file_count = metadata['entry_count'] if metadata else None
+        item.loading = False
+        self.mod_list.update_item(item)
+
+    def _on_saved_mods_loaded(self):
+        self.config.metadata_cache.retain(item.path for item in self.mod_list.items)
+        self.config.metadata_cache.save()
+        logger.info(f"Saved mods loaded: {len(self.mod_list.items)}")
+
+    def _make_list_item(self, mod_info):
+        """Build mod list row data, file count comes from the metadata cache"""
+        metadata = self.config.get_mod_metadata(mod_info)
+        return ModListItem(
+            filename=mod_info['filename'],
+            path=self.config.get_mod_path(mod_info),
+            file_count=metadata['entry_count'] if metadata else None,
+            added=self._format_added(mod_info)
+        )
+
+    @staticmethod
+    def _format_added(mod_info):
+        """Date a mod was added, as shown on its card"""
+        if not mod_info.get('added'):
             return None
+        return datetime.fromisoformat(mod_info['added']).strftime("%d.%m.%Y %H:%M")
 
     def _handle_zip(self, zip_path):
         logger.info(f"Handling ZIP file: {zip_path}")
@@ -299,36 +376,105 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
             return
 
         try:
-            saved_path = self.config.save_mod_file(zip_path)
-            if self._add_mod_card(saved_path):
-                self.status_label.set_success(_("✓ ZIP file has been added!"))
+            self.config.save_mod_file(zip_path)
+            item = self._make_list_item(self.config.get_mod_info(zip_path.name))
+            self.config.metadata_cache.save()
+
+            existing = self.mod_list.find(item.filename)
+            if existing is not None:
+                # Same name added again, the row now shows the new archive
+                existing.path = item.path
+                existing.file_count = item.file_count
+                existing.added = item.added
+                existing.loading = False
+                self.mod_list.update_item(existing)
             else:
-                raise Exception("Failed to add mod card")
+                self.mod_list.add_item(item)
+            self.status_label.set_success(_("✓ ZIP file has been added!"))
 
         except Exception as e:
             logger.error(f"Failed to handle ZIP file: {e}", exc_info=True)
             self.status_label.set_error(_("Error: {error}").format(error=str(e)))
 
-    def _install_mods(self, zip_path):
-        try:
-            logger.info("Starting mod installation")
-            installer = ModInstaller(self.config.modapi_path)
-            installer.install_mods(zip_path)
-            logger.info("Mods installed successfully")
+    def _install_mods(self, mod_card):
+        logger.info(f"Queueing mod installation: {mod_card.filename}")
+        mod_info = self.config.get_mod_info(mod_card.filename)
+        if mod_info is None:
+            logger.error(f"Mod not found in configuration: {mod_card.filename}")
+            return
+
+        queued = self.install_worker.submit(
+            self._run_install,
+            self.config.modapi_path,
+            dict(mod_info),
+            self.config.get_install_workers(),
+            key=mod_card.filename,
+            on_success=self._on_install_success,
+            on_error=self._on_install_error
+        )
+        if queued:
+            self.status_label.set_warning(_("Installing mods..."))
+            self.progress_bar.set(0)
+            self.progress_frame.grid()
+
+    def _run_install(self, modapi_path, mod_info, workers):
+        """
+        Install mods, runs on the install worker thread.
+
+        Returns:
+            str: Filename of the installed mod
+        """
+        logger.info("Starting mod installation")
+        self._cancel_install.clear()
+        installer = ModInstaller(modapi_path)
+        self.config.install_saved_mod(
+            installer, mod_info,
+            progress_callback=lambda progress: self.install_worker.post(
+                self._on_install_progress, progress
+            ),
+            cancel_event=self._cancel_install,
+            workers=workers
+        )
+        return mod_info['filename']
+
+    def _on_install_progress(self, progress):
+        self.progress_bar.set(progress.fraction)
+        self.status_label.set_warning(
+            _("Installing mods... {percent}% ({speed:.1f} MB/s)").format(
+                percent=int(progress.fraction * 100),
+                speed=progress.mb_per_second
+            )
+        )
 
+    def _on_install_success(self, filename):
+        logger.info("Mods installed successfully")
+        self.config.record_install(filename)
+        if not self.install_worker.busy:
+            self.progress_frame.grid_remove()
             self.status_label.set_success(
                 _("✓ Mods installed successfully!")
             )
 
-        except Exception as e:
-            logger.error(f"Failed to install mods: {e}", exc_info=True)
-            self.status_label.set_error(_("Error: {error}").format(error=str(e)))
+    def _on_install_error(self, error):
+        if not self.install_worker.busy:
+            self.progress_frame.grid_remove()
+
+        if isinstance(error, InstallCancelled):
+            logger.info("Mod installation cancelled")
+            self.status_label.set_warning(str(error))
+            return
+
+        logger.error(f"Failed to install mods: {error}")
+        self.status_label.set_error(_("Error: {error}").format(error=str(error)))
+
+    def _cancel_installation(self):
+        logger.info("Cancelling mod installation")
+        self._cancel_install.set()
 
     def _remove_mod_card(self, mod_card):
-        logger.info(f"Removing mod card and file: {mod_card.zip_path}")
-        self.config.remove_mod_file(mod_card.zip_path.name)
-        mod_card.destroy()
-        self.mod_cards.remove(mod_card)
+        logger.info(f"Removing mod card and file: {mod_card.filename}")
+        self.config.remove_mod_file(mod_card.filename)
+        self.mod_list.remove_item(mod_card.filename)
 
     def _open_mods_folder(self):
         if not self.config.modapi_path:
@@ -352,16 +498,15 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
 
     def _open_logs_folder(self):
         logger.info("Opening logs folder")
-        logs_dir = get_logs_dir()
-        latest_log = get_latest_log()
+        current_log = get_log_file()
 
-        if logs_dir.exists():
-            if latest_log:
-                logger.debug(f"Opening logs folder with latest log selected: {latest_log}")
-                open_file_explorer(logs_dir, latest_log)
+        if LOG_DIR.exists():
+            if current_log:
+                logger.debug("Opening logs folder with current log selected: %s", current_log)
+                open_file_explorer(LOG_DIR, current_log)
             else:
                 logger.debug("Opening logs folder (no logs present)")
-                open_file_explorer(logs_dir)
+                open_file_explorer(LOG_DIR)
 
     def _toggle_language(self):
         """Toggle between available languages"""
@@ -394,3 +539,4 @@ class MainWindow(ctk.CTk, TkinterDnD.DnDWrapper):
         self.modapi_button.configure(text=_("Select MODAPI folder"))
         self.mods_folder_button.configure(text=_("Open mods folder"))
         self.logs_button.configure(text=_("logs"))
+        self.cancel_button.configure(text=_("Cancel"))
@@ -66,7 +66,7 @@ class Tutorial:
 
     def next_step(self):
         """Moves to the next step"""
-        logger.debug(f"Moving to next step from step {self.current_step}")
+        logger.debug("Moving to next step from step %s", self.current_step)
         if self.current_step < len(self.steps) - 1:
             self.current_step += 1
             self._show_current_step()
@@ -75,7 +75,7 @@ class Tutorial:
 
     def previous_step(self):
         """Returns to the previous step"""
-        logger.debug(f"Moving to previous step from step {self.current_step}")
+        logger.debug("Moving to previous step from step %s", self.current_step)
         if self.current_step > 0:
             self.current_step -= 1
             self._show_current_step()
@@ -1,8 +1,9 @@
 """
 src/ui/components/version_label.py - Version label component with update check
 """
-import webbrowser
-from datetime import datetime, timedelta
+import queue
+import threading
+import time
 
 import customtkinter as ctk
 
@@ -10,7 +11,6 @@ from src.components.ui.styles import Colors
 from src.config import CURRENT_VERSION
 from src.i18n import _
 from src.logger import setup_logger
-from src.update_checker import check_for_updates, GITHUB_RELEASE_URL
 
 logger = setup_logger("VersionLabel")
 
@@ -21,6 +21,7 @@ class VersionLabel(ctk.CTkFrame):
     def __init__(self, master, config):
         super().__init__(master, fg_color="transparent")
         self.config = config
+        self.new_version = None
 
         # Version label
         self.version_text = ctk.CTkLabel(
@@ -45,24 +46,52 @@ class VersionLabel(ctk.CTkFrame):
         # Position at bottom center
         self.place(relx=0.5, rely=1.0, y=-10, anchor="s")
 
+    POLL_INTERVAL = 200  # Milliseconds between checks for the update thread's result
+
     def check_updates(self):
-        """Check for updates if enough time has passed"""
-        last_check = self.config.get_last_update_check()
+        """
+        Check for updates in the background.
+
+        The release list is cached on disk and only requested again once
+        it is older than the configured interval, so most starts decide
+        from the cache without a request. If the check does not finish
+        within UPDATE_TIMEOUT seconds its result is ignored.
+        """
+        # urllib and the cache are loaded only when the check runs, not at startup
+        from src.update_checker import check_for_updates, GITHUB_API_URL, UPDATE_TIMEOUT
+
+        endpoint = self.config.get_update_endpoint() or GITHUB_API_URL
+        interval = self.config.get_update_check_interval()
 
-        # Check if 24h passed since last check
-        if (not last_check or
-                datetime.fromisoformat(last_check) < datetime.now() - timedelta(days=1)):
-            logger.debug("Checking for updates")
-            new_version = check_for_updates()
-            if new_version:
-                logger.info(f"New version found: {new_version}")
-                self.show_update_button(new_version)
+        logger.debug("Checking for updates")
+        result = queue.Queue()
+        threading.Thread(
+            target=lambda: result.put(check_for_updates(endpoint, interval, UPDATE_TIMEOUT)),
+            name="UpdateCheck",
+            daemon=True
+        ).start()
+        deadline = time.monotonic() + UPDATE_TIMEOUT
+        self.after(self.POLL_INTERVAL, self._poll_update_check, result, deadline)
 
-            self.config.set_last_update_check(datetime.now().isoformat())
+    def _poll_update_check(self, result, deadline):
+        """Wait for the update thread without blocking the Tk thread"""
+        try:
+            new_version = result.get_nowait()
+        except queue.Empty:
+            if time.monotonic() < deadline:
+                self.after(self.POLL_INTERVAL, self._poll_update_check, result, deadline)
+            else:
+                logger.warning("Update check timed out")
+            return
+
+        if new_version:
+            logger.info(f"New version found: {new_version}")
+            self.show_update_button(new_version)
 
     def show_update_button(self, new_version: str):
         """Show update button"""
-        logger.debug(f"Showing update button for version {new_version}")
+        logger.debug("Showing update button for version %s", new_version)
+        self.new_version = new_version
         self.version_text.pack_forget()
         self.update_button.configure(
             text=_("Update to {version} available!").format(version=new_version)
@@ -71,5 +100,11 @@ class VersionLabel(ctk.CTkFrame):
 
     def _open_release_page(self):
         """Open releases page"""
-        logger.debug(f"Opening release page: {GITHUB_RELEASE_URL}")
-        webbrowser.open(GITHUB_RELEASE_URL)
+        import webbrowser
+        from src.update_checker import ReleaseCache, GITHUB_RELEASE_URL
+
+        release = ReleaseCache().get_release(self.new_version) if self.new_version else None
+        url = release.get('html_url') if release else None
+        url = url or GITHUB_RELEASE_URL
+        logger.debug("Opening release page: %s", url)
+        webbrowser.open(url)
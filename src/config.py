@@ -1,32 +1,77 @@
 """
 src/config.py - Application configuration
 """
+import atexit
+import copy
 import json
-import shutil
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
+from .installer import default_worker_count, LINK_COPY, LINK_REFLINK, LINK_HARDLINK
 from .logger import setup_logger
+from .metadata_cache import MetadataCache, scan_index, scan_zip
+from .mod_registry import ModRegistry, SqliteRegistryStore, migrate_saved_mods, SQLITE_THRESHOLD
+from .mod_store import ModStore, FileStore, hash_file
+from .profiling import span
 
 logger = setup_logger("Config")
 
 CONFIG_FILE = Path.home() / '.forest_mod_manager.json'
 MODS_DIR = Path.home() / '.forest_mod_manager' / 'mods'
+STORE_DIR = Path.home() / '.forest_mod_manager' / 'store'
 CURRENT_VERSION = "0.7.1"  # Current program version
+SAVE_DELAY = 0.5  # Seconds changes are collected before the config file is written
+
+# How saved mods are kept on disk
+STORAGE_ARCHIVE = 'archive'  # Whole ZIP, deduplicated per archive
+STORAGE_FILES = 'files'  # Unpacked, deduplicated per file
+
+# Where the saved mods registry is kept
+REGISTRY_JSON = 'json'  # In this config file, under 'saved_mods'
+REGISTRY_SQLITE = 'sqlite'  # In mod_registry.REGISTRY_DB
 
 
 class Config:
     DEFAULT_CONFIG = {
         'modapi_path': None,
-        'saved_mods': [],
+        'saved_mods': {},  # filename -> record, see ModRegistry
+        'registry': REGISTRY_JSON,
         'language': 'en',
         'tutorial_shown': False,
-        'last_update_check': None,
-        'egg_chance': 10  # Default 10% chance
+        'update_check_interval': 24,  # Hours between release list refreshes
+        'update_endpoint': None,  # Releases API URL, None means GitHub
+        'egg_chance': 10,  # Default 10% chance
+        'install_workers': None,  # Extraction threads, None means based on CPU count
+        'storage_mode': STORAGE_ARCHIVE,
+        'link_mode': LINK_REFLINK  # How 'files' storage mode installs place files
     }
 
-    def __init__(self):
+    def __init__(self, save_delay: float = SAVE_DELAY):
+        """
+        Args:
+            save_delay (float): Seconds to collect changes before writing them,
+                0 writes on every save()
+        """
+        self.save_delay = save_delay
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._batch_depth = 0
+        self._save_timer = None
+        atexit.register(self.flush)
+
         self.config = self._load_config()
         self._ensure_mods_dir()
+        self.store = ModStore(MODS_DIR)
+        self.file_store = FileStore(STORE_DIR)
+        self.metadata_cache = MetadataCache()
+        self._open_registry()
+        self._migrate_saved_mods()
 
     def _load_config(self) -> dict:
         """Load or create configuration"""
@@ -40,16 +85,85 @@ class Config:
             logger.error(f"Failed to load config: {e}", exc_info=True)
 
         logger.info("Using default configuration")
-        return self.DEFAULT_CONFIG.copy()
+        return copy.deepcopy(self.DEFAULT_CONFIG)
 
     def save(self):
-        """Save configuration"""
-        try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
-            logger.info("Configuration saved successfully")
-        except Exception as e:
-            logger.error(f"Failed to save config: {e}", exc_info=True)
+        """
+        Mark configuration as changed.
+
+        Changes made within save_delay seconds (or inside a batch()) are
+        written together by a single flush(). Pending changes are also
+        flushed when the program exits.
+        """
+        with self._lock:
+            self._dirty = True
+            if self._batch_depth:
+                return
+            if self.save_delay > 0:
+                if self._save_timer is None:
+                    self._save_timer = threading.Timer(self.save_delay, self.flush)
+                    self._save_timer.daemon = True
+                    self._save_timer.start()
+                return
+        self.flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group changes into one write, for example when adding many mods:
+
+            with config.batch():
+                for path in paths:
+                    config.save_mod_file(path)
+
+        Other threads cannot see or save the configuration halfway through
+        the batch. Batches can be nested.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+        if self._dirty:
+            self.save()
+
+    def flush(self):
+        """Write pending changes to disk now"""
+        with self._write_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return
+                self.mods.commit()
+                data = json.dumps(self.config, indent=4)
+                self._dirty = False
+
+            # Write a temporary file and swap it in, so a crash never leaves
+            # a half written config behind
+            temp_path = CONFIG_FILE.with_name(f".{CONFIG_FILE.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                with span("config.save", bytes=len(data)):
+                    with open(temp_path, 'w', encoding='utf-8') as f:
+                        f.write(data)
+                        f.flush()
+                        with span("config.fsync"):
+                            os.fsync(f.fileno())
+                    os.replace(temp_path, CONFIG_FILE)
+                logger.info("Configuration saved successfully")
+            except Exception as e:
+                logger.error(f"Failed to save config: {e}", exc_info=True)
+                temp_path.unlink(missing_ok=True)
+                with self._lock:
+                    self._dirty = True
+
+    def _set(self, key: str, value):
+        """Change one setting and schedule saving it"""
+        with self._lock:
+            self.config[key] = value
+        self.save()
 
     def _ensure_mods_dir(self):
         """Create mods directory if it doesn't exist"""
@@ -66,33 +180,125 @@ class Config:
 
     @modapi_path.setter
     def modapi_path(self, path: str):
-        self.config['modapi_path'] = path
-        self.save()
+        self._set('modapi_path', path)
+
+    def _open_registry(self):
+        """Load saved mods registry into self.mods, converting the list kept by older versions"""
+        if self.config.get('registry') == REGISTRY_SQLITE:
+            db_store = SqliteRegistryStore()
+            self.mods = ModRegistry(db_store.load(), self.save, db_store)
+            return
+
+        saved_mods = self.config.get('saved_mods', {})
+        self.config['saved_mods'] = migrate_saved_mods(saved_mods)
+        self.mods = ModRegistry(self.config['saved_mods'], self.save)
+        if isinstance(saved_mods, list):
+            self.save()
+
+    def _check_registry_size(self):
+        """Move the registry out of the JSON config once it grows large"""
+        if self.mods.db_store is not None or len(self.mods) <= SQLITE_THRESHOLD:
+            return
+        with self.batch():
+            self.mods.move_to_sqlite(SqliteRegistryStore())
+            self.config['saved_mods'] = {}
+            self.config['registry'] = REGISTRY_SQLITE
+            self.save()
 
     def get_saved_mods(self) -> list:
-        """Returns list of saved mods"""
-        return self.config.get('saved_mods', [])
+        """Returns list of saved mods, in the order they were added"""
+        return list(self.mods)
+
+    def get_mod_info(self, filename: str) -> Optional[dict]:
+        """Returns saved mod with given filename"""
+        return self.mods.get(filename)
+
+    def get_mod_path(self, mod_info: dict) -> Path:
+        """Returns path to the stored archive (or file store index) of a saved mod"""
+        if mod_info.get('storage') == STORAGE_FILES:
+            return self.file_store.index_path(mod_info['hash'])
+        if 'hash' in mod_info:
+            return self.store.blob_path(mod_info['hash'])
+        return MODS_DIR / mod_info['filename']
+
+    def get_mod_metadata(self, mod_info: dict) -> Optional[dict]:
+        """
+        Returns cached metadata of a saved mod (entry_count, uncompressed_size,
+        top_level, hash), reading the archive only if it changed.
+        Call metadata_cache.save() after a batch of lookups.
+        """
+        scanner = scan_index if mod_info.get('storage') == STORAGE_FILES else scan_zip
+        return self.metadata_cache.get(self.get_mod_path(mod_info), mod_info.get('hash'), scanner)
+
+    def _migrate_saved_mods(self):
+        """Move archives saved by older versions (stored by filename) into the store"""
+        for mod_info in self.get_saved_mods():
+            if 'hash' in mod_info:
+                continue
+            legacy_path = MODS_DIR / mod_info['filename']
+            if not legacy_path.exists():
+                continue
+            try:
+                with self.batch():
+                    self.mods.update(mod_info['filename'], hash=self.store.adopt(legacy_path))
+                logger.info(f"Saved mod migrated to content-addressed store: {mod_info['filename']}")
+            except Exception as e:
+                logger.error(f"Failed to migrate mod file {legacy_path}: {e}", exc_info=True)
 
     def save_mod_file(self, original_path: Path) -> Path:
         """
-        Copy mod file to mods folder and save in configuration.
-        Returns path to saved file.
+        Store mod file and save it in configuration.
+
+        Archives are stored by content hash, so the same archive added twice
+        (or under a different name) takes disk space only once. Dropping a
+        file that was already added and did not change since is recognized
+        by its size and modification time, without hashing or copying.
+        In 'files' storage mode the archive is unpacked into the file store
+        instead, where files shared with other mods are stored once.
+
+        Returns path to saved file (file store index in 'files' mode).
         """
         try:
-            target_path = MODS_DIR / original_path.name
+            stat = original_path.stat()
+            source = str(original_path.resolve())
+            storage = self.get_storage_mode()
 
-            shutil.copy2(original_path, target_path)
-            logger.info(f"Copied mod file to: {target_path}")
+            digest = None
+            known = self.mods.find_by_source(source, stat.st_size, stat.st_mtime_ns)
+            if (known is not None
+                    and known.get('storage', STORAGE_ARCHIVE) == storage
+                    and self.get_mod_path(known).exists()):
+                digest = known['hash']
+                logger.info(f"Mod file already stored: {original_path.name}")
 
-            saved_mods = self.get_saved_mods()
-            mod_info = {'filename': target_path.name}
+            if digest is None:
+                digest = hash_file(original_path)
+                if storage == STORAGE_FILES:
+                    if not self.file_store.has_index(digest):
+                        self.file_store.import_archive(original_path, digest)
+                else:
+                    self.store.add(original_path, digest)
 
-            if mod_info not in saved_mods:
-                saved_mods.append(mod_info)
-                self.config['saved_mods'] = saved_mods
-                self.save()
+            mod_info = {
+                'filename': original_path.name,
+                'hash': digest,
+                'storage': storage,
+                'source': source,
+                'size': stat.st_size,
+                'mtime': stat.st_mtime_ns
+            }
+            with self.batch():
+                existing = self.mods.get(mod_info['filename'])
+                if existing is not None and all(existing.get(k) == v for k, v in mod_info.items()):
+                    return self.get_mod_path(existing)
 
-            return target_path
+                mod_info['added'] = datetime.now().isoformat(timespec='seconds')
+                mod_info['install_count'] = existing.get('install_count', 0) if existing else 0
+                self.mods.put(mod_info)
+                if existing is not None:
+                    self._remove_unused_blob(existing.get('hash'))
+                self._check_registry_size()
+            return self.get_mod_path(mod_info)
 
         except Exception as e:
             logger.error(f"Failed to save mod file: {e}", exc_info=True)
@@ -101,37 +307,118 @@ class Config:
     def remove_mod_file(self, filename: str):
         """Remove mod from configuration and disk"""
         try:
-            # Remove from config
-            saved_mods = self.get_saved_mods()
-            self.config['saved_mods'] = [m for m in saved_mods if m['filename'] != filename]
-            self.save()
+            with self.batch():
+                mod_info = self.mods.remove(filename)
+            if mod_info is None:
+                return
 
-            # Remove file
-            mod_path = MODS_DIR / filename
-            if mod_path.exists():
-                mod_path.unlink()
-                logger.info(f"Removed mod file: {filename}")
+            # Remove file, unless another saved mod uses the same archive
+            if 'hash' in mod_info:
+                self._remove_unused_blob(mod_info['hash'])
+            else:
+                mod_path = MODS_DIR / filename
+                if mod_path.exists():
+                    mod_path.unlink()
+                    logger.info(f"Removed mod file: {filename}")
 
         except Exception as e:
             logger.error(f"Failed to remove mod file: {e}", exc_info=True)
 
+    def install_saved_mod(self, installer, mod_info: dict, **options):
+        """
+        Install a saved mod from wherever its storage mode keeps it.
+
+        Args:
+            installer (ModInstaller): Installer for the target MODAPI folder
+            mod_info (dict): Saved mod record
+            **options: Passed to install_mods / install_from_store
+                (incremental, progress_callback, cancel_event, workers)
+        """
+        if mod_info.get('storage') == STORAGE_FILES:
+            return installer.install_from_store(
+                self.file_store, mod_info['hash'], mod_info['filename'],
+                link_mode=self.get_link_mode(), **options
+            )
+        return installer.install_mods(self.get_mod_path(mod_info), **options)
+
+    def record_install(self, filename: str):
+        """Count a successful install of a saved mod"""
+        with self.batch():
+            self.mods.record_install(filename)
+
+    def _remove_unused_blob(self, digest: Optional[str]):
+        """Delete stored archive (or its unpacked files) if no saved mod refers to it"""
+        if digest and not self.mods.is_used(digest):
+            self.store.remove(digest)
+            self.file_store.remove_index(digest)
+
+    def get_storage_mode(self) -> str:
+        """Get how new mods are stored ('archive' or 'files')"""
+        return self.config.get('storage_mode', STORAGE_ARCHIVE)
+
+    def set_storage_mode(self, mode: str):
+        """
+        Set how mods are stored.
+
+        Switching to 'files' also unpacks already saved archives into the
+        file store. Switching back only affects mods added afterwards.
+        """
+        if mode not in (STORAGE_ARCHIVE, STORAGE_FILES):
+            raise ValueError(f"Unknown storage mode: {mode}")
+
+        with self.batch():
+            self.config['storage_mode'] = mode
+            if mode == STORAGE_FILES:
+                self._unpack_saved_mods()
+            self.save()
+
+    def _unpack_saved_mods(self):
+        """Move saved archives into the file store"""
+        unpacked = set()
+        for mod_info in self.get_saved_mods():
+            if mod_info.get('storage', STORAGE_ARCHIVE) != STORAGE_ARCHIVE or 'hash' not in mod_info:
+                continue
+            digest = mod_info['hash']
+            try:
+                if not self.file_store.has_index(digest):
+                    self.file_store.import_archive(self.store.blob_path(digest), digest)
+                self.mods.update(mod_info['filename'], storage=STORAGE_FILES)
+                unpacked.add(digest)
+            except Exception as e:
+                logger.error(f"Failed to unpack {mod_info['filename']}: {e}", exc_info=True)
+
+        # Archives are no longer needed once every mod using them is unpacked
+        still_used = {
+            m['hash'] for m in self.get_saved_mods()
+            if m.get('storage', STORAGE_ARCHIVE) == STORAGE_ARCHIVE and 'hash' in m
+        }
+        for digest in unpacked - still_used:
+            self.store.remove(digest)
+        logger.info(f"Unpacked {len(unpacked)} saved archives into file store")
+
     def was_tutorial_shown(self) -> bool:
         """Check if tutorial was shown"""
         return self.config.get('tutorial_shown', False)
 
     def set_tutorial_shown(self, shown: bool):
         """Save information about tutorial being shown"""
-        self.config['tutorial_shown'] = shown
-        self.save()
+        self._set('tutorial_shown', shown)
 
-    def get_last_update_check(self) -> str:
-        """Get date of last update check"""
-        return self.config.get('last_update_check')
+    def get_update_check_interval(self) -> float:
+        """Get hours between release list refreshes"""
+        return self.config.get('update_check_interval', 24)
 
-    def set_last_update_check(self, date: str):
-        """Save update check date"""
-        self.config['last_update_check'] = date
-        self.save()
+    def set_update_check_interval(self, hours: float):
+        """Set hours between release list refreshes (0 refreshes on every start)"""
+        self._set('update_check_interval', max(0, hours))
+
+    def get_update_endpoint(self) -> Optional[str]:
+        """Get releases API URL, None for the default GitHub endpoint"""
+        return self.config.get('update_endpoint')
+
+    def set_update_endpoint(self, url: Optional[str]):
+        """Set releases API URL (None for GitHub), e.g. a mirror or a local test server"""
+        self._set('update_endpoint', url)
 
     @property
     def language(self) -> str:
@@ -141,13 +428,32 @@ class Config:
     @language.setter
     def language(self, lang_code: str):
         """Set and save language"""
-        self.config['language'] = lang_code
-        self.save()
+        self._set('language', lang_code)
 
     def get_egg_chance(self) -> float:
         return self.config.get('egg_chance', 10) / 100
 
     def set_egg_chance(self, chance: int):
         """Set chance for easter egg appearance (0-100)"""
-        self.config['egg_chance'] = max(0, min(100, chance))  # Limit to 0-100 range
-        self.save()
+        self._set('egg_chance', max(0, min(100, chance)))  # Limit to 0-100 range
+
+    def get_install_workers(self) -> int:
+        """Get number of threads used to extract mods"""
+        workers = self.config.get('install_workers')
+        if not workers:
+            return default_worker_count()
+        return workers
+
+    def set_install_workers(self, workers: Optional[int]):
+        """Set number of extraction threads (None for automatic)"""
+        self._set('install_workers', max(1, workers) if workers else None)
+
+    def get_link_mode(self) -> str:
+        """Get how files are placed when installing from the file store"""
+        return self.config.get('link_mode', LINK_REFLINK)
+
+    def set_link_mode(self, mode: str):
+        """Set link mode ('copy', 'reflink' or 'hardlink')"""
+        if mode not in (LINK_COPY, LINK_REFLINK, LINK_HARDLINK):
+            raise ValueError(f"Unknown link mode: {mode}")
+        self._set('link_mode', mode)
@@ -22,7 +22,7 @@ class I18n:
         """Initialize the translation system"""
         try:
             locale_dir = get_asset_path("locales")
-            logger.debug(f"Loading translations from: {locale_dir}")
+            logger.debug("Loading translations from: %s", locale_dir)
 
             self._translator = gettext.translation(
                 "forest_mod_manager",
@@ -0,0 +1,126 @@
+"""
+src/install_worker.py - Background worker running installs off the Tk thread
+"""
+import queue
+import threading
+
+from src.logger import setup_logger
+
+logger = setup_logger("InstallWorker")
+
+
+class InstallWorker:
+    """
+    Runs jobs one at a time on a background thread.
+
+    Jobs are queued in order, so repeated install requests are serialized.
+    Results are delivered back on the Tk thread: the worker thread only
+    puts them on a queue, which is drained by a polling after() callback.
+    """
+
+    def __init__(self, master, poll_interval=50):
+        """
+        Args:
+            master: Tk widget used to schedule after() callbacks
+            poll_interval (int): Milliseconds between result queue checks
+        """
+        self.master = master
+        self.poll_interval = poll_interval
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._pending_keys = set()
+        self._pending = 0
+        self._polling = False
+
+        self._thread = threading.Thread(target=self._run, name="InstallWorker", daemon=True)
+        self._thread.start()
+        logger.debug("Install worker started")
+
+    @property
+    def busy(self) -> bool:
+        """True while any job is queued or running"""
+        return self._pending > 0
+
+    def submit(self, func, *args, key=None, on_success=None, on_error=None):
+        """
+        Queue a job. Must be called from the Tk thread.
+
+        Args:
+            func (callable): Function to run on the worker thread
+            *args: Arguments for func
+            key: Optional job identity; a job whose key is already queued is ignored
+            on_success (callable): Called on the Tk thread with func's result
+            on_error (callable): Called on the Tk thread with the raised exception
+
+        Returns:
+            bool: True if the job was queued, False if it was a duplicate
+        """
+        if key is not None:
+            if key in self._pending_keys:
+                logger.debug("Job already queued, ignoring: %s", key)
+                return False
+            self._pending_keys.add(key)
+
+        self._pending += 1
+        self._jobs.put((func, args, key, on_success, on_error))
+        logger.debug("Job queued (%s pending)", self._pending)
+
+        if not self._polling:
+            self._polling = True
+            self.master.after(self.poll_interval, self._poll)
+        return True
+
+    def post(self, callback, *args):
+        """
+        Run callback on the Tk thread. Meant to be called from a running job.
+
+        Args:
+            callback (callable): Function to call
+            *args: Arguments for callback
+        """
+        self._results.put((callback, args))
+
+    def shutdown(self):
+        """Stop the worker thread after queued jobs finish"""
+        self._jobs.put(None)
+
+    def _run(self):
+        """Worker thread loop"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                logger.debug("Install worker stopped")
+                return
+
+            func, args, key, on_success, on_error = job
+            try:
+                result = func(*args)
+            except Exception as e:
+                logger.error(f"Background job failed: {e}", exc_info=True)
+                self._results.put((self._finish, (key, on_error, e)))
+            else:
+                self._results.put((self._finish, (key, on_success, result)))
+
+    def _finish(self, key, callback, value):
+        """Complete a job on the Tk thread"""
+        self._pending -= 1
+        self._pending_keys.discard(key)
+        if callback:
+            callback(value)
+
+    def _poll(self):
+        """Deliver finished results on the Tk thread"""
+        while True:
+            try:
+                callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Install worker callback failed: {e}", exc_info=True)
+
+        if self._pending > 0:
+            self.master.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
@@ -1,16 +1,264 @@
 """
 src/installer.py - Mod installation logic
 """
+import contextlib
+import json
 import os
 import shutil
+import sys
+import threading
+import time
+import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from typing import Callable, Optional
 
 from src.i18n import _
 from src.logger import setup_logger
+from src.profiling import span
 
 logger = setup_logger("ModInstaller")
 
+# Manifest of installed files, kept next to the mods/TheForest folder
+MANIFEST_FILENAME = "TheForest.manifest.json"
+PREVIOUS_MANIFEST_FILENAME = "TheForest.previous.manifest.json"
+STAGING_MANIFEST_FILENAME = "TheForest.staging.manifest.json"
+# Renames of a swap in progress, replayed if the program stops halfway
+SWAP_JOURNAL_FILENAME = "TheForest.swap.json"
+MANIFEST_VERSION = 2
+
+# Sibling folders used for staged installs and rollback
+STAGING_DIRNAME = "TheForest.staging"
+PREVIOUS_DIRNAME = "TheForest.previous"
+# Folders renamed aside to be deleted in the background
+TRASH_PREFIX = "TheForest.trash."
+
+# Extraction copies entries in chunks of this size
+CHUNK_SIZE = 1024 * 1024
+# Minimum time between two progress callbacks, in seconds
+PROGRESS_INTERVAL = 0.1
+
+# How files are placed when installing from the file store
+LINK_COPY = 'copy'  # Always copy bytes
+LINK_REFLINK = 'reflink'  # Copy-on-write clone where the filesystem supports it, else copy
+LINK_HARDLINK = 'hardlink'  # Reflink, else hardlink to the store blob, else copy
+
+# Linux ioctl creating a copy-on-write clone (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+def reflink(src: Path, dst: Path) -> bool:
+    """
+    Create dst as a copy-on-write clone of src.
+
+    Returns:
+        bool: True if cloned, False if not supported here
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+
+    import fcntl
+    try:
+        with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+        return True
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+
+
+class InstallCancelled(Exception):
+    """Raised when an install is cancelled before it finished"""
+
+
+@dataclass
+class ExtractProgress:
+    """Snapshot of extraction progress passed to progress callbacks"""
+    bytes_done: int
+    bytes_total: int
+    files_done: int
+    files_total: int
+    elapsed: float  # Seconds since extraction started
+
+    @property
+    def fraction(self) -> float:
+        """Part of the work done, from 0.0 to 1.0"""
+        if self.bytes_total:
+            return self.bytes_done / self.bytes_total
+        return self.files_done / self.files_total if self.files_total else 1.0
+
+    @property
+    def mb_per_second(self) -> float:
+        """Average extraction throughput"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.bytes_done / (1024 * 1024) / self.elapsed
+
+
+# Trash folders a background thread is deleting right now
+_trash_lock = threading.Lock()
+_trash_done = threading.Condition(_trash_lock)  # Notified when a folder was deleted
+_trash_pending = set()
+
+
+def _delete_tree(path: Path):
+    """Delete a folder tree, logging one summary line instead of a line per item"""
+    start = time.perf_counter()
+    failed = []
+    with span("install.reclaim", folder=path.name):
+        shutil.rmtree(path, onerror=lambda func, name, exc_info: failed.append(name))
+    if failed:
+        logger.warning(f"Could not delete {len(failed)} items of {path.name}, first: {failed[0]}")
+    else:
+        logger.info(f"Deleted {path.name} in {time.perf_counter() - start:.2f}s")
+
+
+def _delete_trash(paths):
+    for path in paths:
+        try:
+            _delete_tree(path)
+        finally:
+            with _trash_done:
+                _trash_pending.discard(path)
+                _trash_done.notify_all()
+
+
+def wait_for_trash(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until background threads deleted the folders discarded so far.
+
+    The threads are daemons, so a short-lived process (like a CLI command)
+    has to call this before exiting, or deleting stops halfway.
+
+    Args:
+        timeout (float): Seconds to wait at most, None waits until done
+
+    Returns:
+        bool: True if nothing is left to delete
+    """
+    with _trash_done:
+        return _trash_done.wait_for(lambda: not _trash_pending, timeout)
+
+
+def default_worker_count() -> int:
+    """Number of extraction threads used when not configured"""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+class _ProgressReporter:
+    """
+    Counts extracted bytes and files, throttles callbacks and checks for cancellation.
+    Shared by all extraction threads.
+    """
+
+    def __init__(self, bytes_total, files_total, callback=None, cancel_event=None):
+        self.bytes_total = bytes_total
+        self.files_total = files_total
+        self.bytes_done = 0
+        self.files_done = 0
+        self.callback = callback
+        self.cancel_event = cancel_event
+        self.started = time.perf_counter()
+        self._last_report = 0.0
+        self._lock = threading.Lock()
+        self._aborted = False
+
+    def abort(self):
+        """Make other extraction threads stop at their next check"""
+        self._aborted = True
+
+    def check_cancelled(self):
+        if self._aborted or (self.cancel_event is not None and self.cancel_event.is_set()):
+            raise InstallCancelled(_("Installation cancelled"))
+
+    def add_bytes(self, count):
+        with self._lock:
+            self.bytes_done += count
+        self._report()
+
+    def file_done(self):
+        with self._lock:
+            self.files_done += 1
+        self._report()
+
+    def snapshot(self) -> ExtractProgress:
+        return ExtractProgress(
+            self.bytes_done, self.bytes_total,
+            self.files_done, self.files_total,
+            time.perf_counter() - self.started
+        )
+
+    def finish(self) -> ExtractProgress:
+        progress = self.snapshot()
+        if self.callback:
+            self.callback(progress)
+        return progress
+
+    def _report(self):
+        if not self.callback:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            if now - self._last_report < PROGRESS_INTERVAL:
+                return
+            self._last_report = now
+        self.callback(self.snapshot())
+
+
+class _StoreReader:
+    """
+    Reads an archive unpacked in FileStore through the same interface
+    as zipfile.ZipFile (infolist() and open()), so extraction code
+    handles both sources.
+    """
+
+    def __init__(self, file_store, index, link_mode=LINK_COPY):
+        self.file_store = file_store
+        self._can_reflink = link_mode in (LINK_REFLINK, LINK_HARDLINK)
+        self._can_hardlink = link_mode == LINK_HARDLINK
+        self._infos = [zipfile.ZipInfo(name) for name in index['dirs']]
+        self._hashes = {}
+        for name, record in index['files'].items():
+            info = zipfile.ZipInfo(name)
+            info.file_size = info.compress_size = record['size']
+            info.CRC = record['crc']
+            self._infos.append(info)
+            self._hashes[info.filename] = record['hash']
+
+    def infolist(self):
+        return self._infos
+
+    def open(self, info):
+        return self.file_store.open_blob(self._hashes[info.filename])
+
+    def place(self, info, target: Path) -> bool:
+        """
+        Put the file at target without copying bytes, if the link mode allows.
+
+        Returns:
+            bool: True if placed, False if the file has to be copied
+        """
+        blob = self.file_store.blob_path(self._hashes[info.filename])
+
+        if self._can_reflink:
+            if reflink(blob, target):
+                return True
+            logger.debug("Reflinks not supported, not trying again")
+            self._can_reflink = False
+
+        if self._can_hardlink:
+            try:
+                os.link(blob, target)
+                return True
+            except OSError as e:
+                logger.warning(f"Hardlinks to file store not available, copying files: {e}")
+                self._can_hardlink = False
+
+        return False
+
 
 class ModInstaller:
     def __init__(self, modapi_path):
@@ -20,7 +268,13 @@ class ModInstaller:
         """
         self.modapi_path = Path(modapi_path)
         self.mods_path = self.modapi_path / "mods" / "TheForest"
-        logger.debug(f"Initialized ModInstaller with path: {modapi_path}")
+        self.manifest_path = self.mods_path.parent / MANIFEST_FILENAME
+        self.previous_manifest_path = self.mods_path.parent / PREVIOUS_MANIFEST_FILENAME
+        self.staging_manifest_path = self.mods_path.parent / STAGING_MANIFEST_FILENAME
+        self.journal_path = self.mods_path.parent / SWAP_JOURNAL_FILENAME
+        self.staging_path = self.mods_path.parent / STAGING_DIRNAME
+        self.previous_path = self.mods_path.parent / PREVIOUS_DIRNAME
+        logger.debug("Initialized ModInstaller with path: %s", modapi_path)
 
     def verify_paths(self):
         """
@@ -41,42 +295,702 @@ class ModInstaller:
         logger.debug("Path verification successful")
         return True
 
-    def install_mods(self, zip_path):
+    def install_mods(self, zip_path, incremental=True,
+                     progress_callback: Optional[Callable[[ExtractProgress], None]] = None,
+                     cancel_event=None, workers: int = 1):
         """
         Install mods from ZIP file.
 
+        The archive is extracted into a staging folder next to TheForest
+        and swapped in with renames, so the live folder is never left half
+        written. The replaced tree is kept as the previous generation
+        (see rollback()).
+
+        With incremental install the ZIP's central directory is compared
+        against the manifest of the current install, and files that did not
+        change are not extracted again: they are moved from the live folder
+        into the new tree when it is swapped in. The previous generation
+        then only holds files that changed or were removed, the files it
+        shares with the new install are moved back to it before a rollback.
+        Without a usable manifest every file is extracted.
+
+        Entries are streamed in fixed-size chunks, so progress is reported
+        while large files are written and the install can be cancelled
+        between chunks. A cancelled install leaves TheForest untouched.
+
+        With more than one worker, entries are split across a thread pool,
+        each thread reading the archive through its own ZipFile handle.
+        zlib releases the GIL while inflating, so this scales with cores
+        on packs with many medium-sized files.
+
         Args:
             zip_path (str): Path to ZIP file with mods
+            incremental (bool): Reuse files that did not change since the current install
+            progress_callback (callable): Receives ExtractProgress snapshots,
+                called from the installing thread
+            cancel_event (threading.Event): Set it to cancel the install
+            workers (int): Number of extraction threads
 
         Raises:
+            InstallCancelled: If cancel_event was set
             Exception: If installation fails
         """
-        if not self.verify_paths():
-            error_msg = _("Invalid MODAPI folder structure!\nMake sure you selected the main MODAPI folder.")
-            logger.error("Invalid MODAPI folder structure")
-            raise Exception(error_msg)
+        with span("install.validate"):
+            self._recover_interrupted_swap()
 
-        if not zipfile.is_zipfile(zip_path):
-            error_msg = _("Selected file is not a valid ZIP file!")
-            logger.error("Invalid ZIP file")
-            raise Exception(error_msg)
+            if not self.verify_paths():
+                error_msg = _("Invalid MODAPI folder structure!\nMake sure you selected the main MODAPI folder.")
+                logger.error("Invalid MODAPI folder structure")
+                raise Exception(error_msg)
+
+            if not zipfile.is_zipfile(zip_path):
+                error_msg = _("Selected file is not a valid ZIP file!")
+                logger.error("Invalid ZIP file")
+                raise Exception(error_msg)
 
-        # Clear TheForest folder
-        self._clear_mods()
+        zip_path = Path(zip_path)
+        stat = zip_path.stat()
+        source = {
+            'name': zip_path.name,
+            'path': str(zip_path),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns
+        }
 
-        # Extract new mods
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(self.mods_path)
-            logger.info("Mods installed successfully")
+            self._install(
+                zip_ref, lambda: zipfile.ZipFile(zip_path, 'r'), source,
+                incremental, progress_callback, cancel_event, workers
+            )
+
+    def install_from_store(self, file_store, archive_digest, name=None, incremental=True,
+                           progress_callback: Optional[Callable[[ExtractProgress], None]] = None,
+                           cancel_event=None, workers: int = 1, link_mode=LINK_COPY):
+        """
+        Install mods from an archive unpacked in the file store.
+
+        Works like install_mods(), but files are copied from the store's
+        blobs, so nothing has to be decompressed.
+
+        When the store and the MODAPI folder are on the same filesystem,
+        files can be placed without copying any bytes: LINK_REFLINK clones
+        them copy-on-write where supported (btrfs, XFS on Linux), and
+        LINK_HARDLINK additionally falls back to hardlinks. Hardlinked files
+        share data with the store, so a mod editing its own files in place
+        would also change the stored copy. Anything that cannot be linked
+        is copied.
+
+        Args:
+            file_store (FileStore): Store holding the unpacked archive
+            archive_digest (str): Hash of the unpacked archive
+            name (str): Mod name recorded in the manifest
+            incremental (bool): Reuse files that did not change since the current install
+            progress_callback (callable): Receives ExtractProgress snapshots,
+                called from the installing thread
+            cancel_event (threading.Event): Set it to cancel the install
+            workers (int): Number of copying threads
+            link_mode (str): LINK_COPY, LINK_REFLINK or LINK_HARDLINK
+
+        Raises:
+            InstallCancelled: If cancel_event was set
+            Exception: If installation fails
+        """
+        with span("install.validate"):
+            self._recover_interrupted_swap()
+
+            if not self.verify_paths():
+                error_msg = _("Invalid MODAPI folder structure!\nMake sure you selected the main MODAPI folder.")
+                logger.error("Invalid MODAPI folder structure")
+                raise Exception(error_msg)
+
+        if link_mode != LINK_COPY and not self._same_filesystem(file_store.root):
+            logger.info("File store is on another filesystem, copying files")
+            link_mode = LINK_COPY
+
+        reader = _StoreReader(file_store, file_store.load_index(archive_digest), link_mode)
+        source = {'name': name, 'hash': archive_digest}
+        self._install(
+            reader, lambda: contextlib.nullcontext(reader), source,
+            incremental, progress_callback, cancel_event, workers
+        )
+
+    def _install(self, reader, open_reader, source, incremental,
+                 progress_callback, cancel_event, workers):
+        """
+        Stage files from reader, swap them in and record the manifest.
+
+        Args:
+            reader: Opened zipfile.ZipFile or _StoreReader
+            open_reader (callable): Opens another reader of the same source,
+                for use by extraction threads
+            source (dict): Description of the source for the manifest
+        """
+        with span("install", source=source.get('name'), incremental=incremental, workers=workers):
+            manifest = self._load_manifest() if incremental else None
+            with span("install.extract"):
+                files, unchanged = self._extract_to_staging(
+                    reader, open_reader, manifest, progress_callback, cancel_event, workers
+                )
+            with span("install.manifest", files=len(files)):
+                self._save_manifest(self._build_manifest(source, files), self.staging_manifest_path)
+            with span("install.swap", unchanged=len(unchanged)):
+                self._swap_in_staging(unchanged)
+        logger.info("Mods installed successfully")
+
+    def can_rollback(self):
+        """
+        Check if a previous generation of mods is available.
+
+        Returns:
+            bool: True if rollback() can restore an earlier install
+        """
+        return self.previous_path.is_dir()
+
+    def rollback(self):
+        """
+        Swap the current install with the previous generation.
+
+        Both trees are only renamed, after moving the files they share
+        from the current tree to the previous one, so rolling back never
+        copies or extracts anything. Calling it again rolls forward.
+
+        Raises:
+            Exception: If there is no previous generation
+        """
+        self._recover_interrupted_swap()
+
+        if not self.can_rollback():
+            error_msg = _("No previous mods installation to restore!")
+            logger.error("No previous generation to roll back to")
+            raise Exception(error_msg)
+
+        if self.staging_path.exists():
+            self._discard_tree(self.staging_path)
+        self._remove_manifest(self.staging_manifest_path)
+
+        # Complete the previous tree, then rotate trees and their manifests
+        # through the staging names
+        self._run_swap_journal("rollback", [
+            (self.mods_path, self.staging_path),
+            (self.manifest_path, self.staging_manifest_path),
+            (self.previous_path, self.mods_path),
+            (self.previous_manifest_path, self.manifest_path),
+            (self.staging_path, self.previous_path),
+            (self.staging_manifest_path, self.previous_manifest_path)
+        ], moves=(self.mods_path, self.previous_path, self._shared_with_previous()))
+        logger.info("Rolled back to previous mods installation")
+
+    def get_manifest(self):
+        """
+        Get manifest describing the current install.
+
+        Returns:
+            dict | None: Installed ZIP ('source'), install date ('installed_at')
+                and installed files ('files') with size, CRC32 and mtime,
+                or None if nothing was installed by this program
+        """
+        return self._load_manifest()
+
+    def verify_installation(self):
+        """
+        Check installed files against the manifest using only file stats.
+
+        Returns:
+            dict | None: Lists of 'missing' and 'modified' file paths,
+                or None if there is no manifest to verify against
+        """
+        manifest = self._load_manifest()
+        if manifest is None:
+            return None
+
+        missing = []
+        modified = []
+        for name, record in manifest['files'].items():
+            try:
+                stat = (self.mods_path / name).stat()
+            except FileNotFoundError:
+                missing.append(name)
+                continue
+            if stat.st_size != record['size'] or stat.st_mtime_ns != record['mtime']:
+                modified.append(name)
+
+        logger.info(f"Verified {len(manifest['files'])} files: "
+                    f"{len(missing)} missing, {len(modified)} modified")
+        return {'missing': missing, 'modified': modified}
+
+    def uninstall_mods(self):
+        """
+        Remove installed mods.
+
+        Only files listed in the manifest (and folders left empty) are
+        removed, so the folder tree does not have to be walked. Without
+        a manifest the whole TheForest folder is cleared. Files shared
+        with the previous generation are moved to it, so it can still be
+        restored.
+        """
+        if self.can_rollback():
+            self._move_files(self.mods_path, self.previous_path, self._shared_with_previous())
+        manifest = self._load_manifest()
+        self._remove_manifest()
+        if manifest is None:
+            self._clear_mods()
+            return
+
+        dirs = set()
+        for name in manifest['files']:
+            try:
+                (self.mods_path / name).unlink()
+            except FileNotFoundError:
+                pass
+            parts = name.split('/')
+            for i in range(1, len(parts)):
+                dirs.add('/'.join(parts[:i]))
+
+        for name in sorted(dirs, key=lambda d: d.count('/'), reverse=True):
+            try:
+                (self.mods_path / name).rmdir()
+            except OSError:
+                # Not empty (files added outside the installer) or already gone
+                pass
+
+        logger.info(f"Uninstalled {len(manifest['files'])} files")
+
+    def _extract_to_staging(self, reader, open_reader, manifest, progress_callback=None,
+                            cancel_event=None, workers=1):
+        """
+        Build the new mods tree in the staging folder.
+
+        Args:
+            reader: Opened zipfile.ZipFile or _StoreReader to install from
+            open_reader (callable): Opens another reader for extraction threads
+            manifest (dict | None): Manifest of the current install, used to
+                reuse unchanged files
+            progress_callback (callable): Receives ExtractProgress snapshots
+            cancel_event (threading.Event): Cancels extraction when set
+            workers (int): Number of extraction threads
+
+        Returns:
+            tuple: (files, unchanged) manifest records of all files of the
+                new install, and names of those to move over from TheForest
+        """
+        if self.staging_path.exists():
+            logger.debug("Removing leftover staging folder")
+            self._discard_tree(self.staging_path)
+        self.staging_path.mkdir()
+
+        installed = manifest['files'] if manifest else {}
+        files = {}
+        unchanged = []
+        placed = 0
+
+        entries = []
+        for info in reader.infolist():
+            if self._is_safe_name(info.filename):
+                entries.append(info)
+            else:
+                logger.warning(f"Skipping ZIP entry with unsafe path: {info.filename}")
+
+        file_entries = [info for info in entries if not info.is_dir()]
+        reporter = _ProgressReporter(
+            sum(info.file_size for info in file_entries), len(file_entries),
+            progress_callback, cancel_event
+        )
+
+        to_extract = []
+        try:
+            for info in entries:
+                reporter.check_cancelled()
+                if info.is_dir():
+                    (self.staging_path / info.filename).mkdir(parents=True, exist_ok=True)
+                    continue
+
+                record = installed.get(info.filename)
+                if self._is_unchanged(info, record):
+                    # Moved over from TheForest by _swap_in_staging()
+                    files[info.filename] = record
+                    unchanged.append(info.filename)
+                    reporter.add_bytes(info.file_size)
+                    reporter.file_done()
+                    continue
+
+                if isinstance(reader, _StoreReader):
+                    target = self.staging_path / info.filename
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    if reader.place(info, target):
+                        files[info.filename] = self._file_record(info, self.staging_path)
+                        placed += 1
+                        reporter.add_bytes(info.file_size)
+                        reporter.file_done()
+                        continue
+
+                to_extract.append(info)
+
+            self._extract_entries(reader, open_reader, to_extract, reporter, workers)
+            for info in to_extract:
+                files[info.filename] = self._file_record(info, self.staging_path)
+        except InstallCancelled:
+            logger.info("Installation cancelled, discarding staging folder")
+            self._discard_tree(self.staging_path)
+            raise
+        except BaseException:
+            # Also on KeyboardInterrupt, so Ctrl-C leaves no staging folder behind
+            self._discard_tree(self.staging_path)
+            raise
+
+        progress = reporter.finish()
+        removed = len(set(installed) - set(files))
+        logger.info(
+            f"Staged install: {len(to_extract)} extracted, {placed} linked from store, "
+            f"{len(unchanged)} unchanged, {removed} removed; {progress.bytes_done / (1024 * 1024):.1f} MB "
+            f"in {progress.elapsed:.2f}s ({progress.mb_per_second:.1f} MB/s)"
+        )
+        return files, unchanged
+
+    def _extract_entries(self, reader, open_reader, entries, reporter, workers):
+        """
+        Extract archive entries into the staging folder, in parallel if requested.
+
+        Args:
+            reader: Opened zipfile.ZipFile or _StoreReader
+            open_reader (callable): Opens another reader for each thread
+            entries (list): ZipInfo objects of files to extract
+            reporter (_ProgressReporter): Shared progress counter
+            workers (int): Number of extraction threads
+        """
+        workers = min(workers, len(entries))
+        if workers <= 1:
+            for info in entries:
+                self._extract_entry(reader, info, self.staging_path, reporter)
+            return
+
+        # Largest entries first, each to the least loaded bucket
+        buckets = [[] for _ in range(workers)]
+        loads = [0] * workers
+        for info in sorted(entries, key=lambda i: i.compress_size, reverse=True):
+            index = loads.index(min(loads))
+            buckets[index].append(info)
+            loads[index] += info.compress_size
+
+        logger.debug("Extracting %s files with %s threads", len(entries), workers)
+        error = None
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Extract") as pool:
+            futures = [
+                pool.submit(self._extract_bucket, open_reader, bucket, reporter)
+                for bucket in buckets
+            ]
+            try:
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        if error is None:
+                            error = e
+                            reporter.abort()
+            except BaseException:
+                # Ctrl-C is raised here, stop the workers before the pool waits for them
+                reporter.abort()
+                raise
+        if error is not None:
+            raise error
+
+    def _extract_bucket(self, open_reader, entries, reporter):
+        """Extract a share of the entries through a separate reader"""
+        with open_reader() as reader, span("install.extract_bucket", files=len(entries)):
+            for info in entries:
+                self._extract_entry(reader, info, self.staging_path, reporter)
+
+    @staticmethod
+    def _extract_entry(reader, info, base_path, reporter):
+        """Stream one archive entry to disk in chunks"""
+        target = base_path / info.filename
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with reader.open(info) as src, open(target, 'wb') as dst:
+            while True:
+                reporter.check_cancelled()
+                chunk = src.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                dst.write(chunk)
+                reporter.add_bytes(len(chunk))
+        reporter.file_done()
+
+    @staticmethod
+    def _is_safe_name(name):
+        """Check if archive entry stays inside the target folder"""
+        parts = name.replace('\\', '/').split('/')
+        return (
+                not name.startswith(('/', '\\'))
+                and '..' not in parts
+                and ':' not in parts[0]
+        )
+
+    def _is_unchanged(self, info, record):
+        """Check if installed file described by record matches archive entry"""
+        if record is None or record['size'] != info.file_size or record['crc'] != info.CRC:
+            return False
+        try:
+            stat = os.stat(os.path.join(self.mods_path, info.filename))
+        except OSError:
+            return False
+        return stat.st_size == record['size'] and stat.st_mtime_ns == record['mtime']
+
+    def _swap_in_staging(self, unchanged: list):
+        """
+        Replace TheForest folder and its manifest with the staged ones,
+        keeping the old pair as the previous generation.
+
+        Args:
+            unchanged (list): Files moved from TheForest into the new tree
+        """
+        if self.previous_path.exists():
+            logger.debug("Removing old previous generation")
+            with span("install.clear", folder=PREVIOUS_DIRNAME):
+                self._discard_tree(self.previous_path)
+        self._remove_manifest(self.previous_manifest_path)
+
+        try:
+            self._run_swap_journal("install", [
+                (self.manifest_path, self.previous_manifest_path),
+                (self.mods_path, self.previous_path),
+                (self.staging_path, self.mods_path),
+                (self.staging_manifest_path, self.manifest_path)
+            ], moves=(self.mods_path, self.staging_path, unchanged))
+        except OSError:
+            self._discard_tree(self.staging_path)
+            self._remove_manifest(self.staging_manifest_path)
+            raise
+        logger.debug("Staging folder swapped in")
+
+    def _run_swap_journal(self, operation: str, renames: list, moves: tuple = None):
+        """
+        Rename files and folders in order, recording progress in a journal.
+
+        If the program stops halfway, _recover_interrupted_swap() finishes
+        the remaining renames, so trees and manifests always end up in
+        matching pairs. Sources that don't exist (no manifest) are skipped.
+        If a rename fails, the finished ones are undone before raising.
+
+        Args:
+            operation (str): 'install' or 'rollback', for the log
+            renames (list): (source, destination) paths
+            moves (tuple): (source root, destination root, names) of files
+                to move between trees before the renames
+        """
+        journal = {
+            'operation': operation,
+            'moves': None,
+            'renames': [[str(src), str(dst)] for src, dst in renames],
+            'done': 0
+        }
+        if moves:
+            src_root, dst_root, names = moves
+            journal['moves'] = {'from': str(src_root), 'to': str(dst_root), 'names': names}
+        self._write_journal(journal)
+        done = []
+        try:
+            if moves:
+                self._move_files(*moves)
+            for src, dst in renames:
+                if os.path.lexists(src):
+                    os.replace(src, dst)
+                    done.append((src, dst))
+                journal['done'] += 1
+                self._write_journal(journal)
+        except OSError:
+            for src, dst in reversed(done):
+                os.replace(dst, src)
+            if moves:
+                self._move_files(dst_root, src_root, names)
+            self.journal_path.unlink()
+            raise
+        self.journal_path.unlink()
+
+    @staticmethod
+    def _move_files(src_root: Path, dst_root: Path, names):
+        """Move files to the same paths in another tree, skipping those already moved"""
+        # Plain strings, Path objects cost more than the renames on small files
+        src_root, dst_root = str(src_root), str(dst_root)
+        created = set()
+        for name in names:
+            dst = os.path.join(dst_root, name)
+            if os.path.lexists(dst):
+                continue
+            parent = os.path.dirname(dst)
+            if parent not in created:
+                os.makedirs(parent, exist_ok=True)
+                created.add(parent)
+            try:
+                os.replace(os.path.join(src_root, name), dst)
+            except FileNotFoundError:
+                pass
+
+    def _shared_with_previous(self) -> list:
+        """
+        Files the previous generation shares with the current install.
+
+        Installs move unchanged files into the new tree, so these are
+        missing from the previous folder until they are moved back.
+
+        Returns:
+            list: Paths relative to TheForest
+        """
+        previous = self._load_manifest(self.previous_manifest_path)
+        if previous is None:
+            return []
+        current = self._load_manifest()
+        if current is None:
+            # Whatever the previous folder lacks is taken from TheForest
+            return list(previous['files'])
+        shared = []
+        for name, record in previous['files'].items():
+            installed = current['files'].get(name)
+            if installed and installed['size'] == record['size'] and installed['crc'] == record['crc']:
+                shared.append(name)
+        return shared
+
+    def _write_journal(self, journal: dict):
+        temp_path = self.journal_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(journal))
+        os.replace(temp_path, self.journal_path)
+
+    def _same_filesystem(self, path: Path) -> bool:
+        """Check if path is on the same filesystem as TheForest folder"""
+        try:
+            return os.stat(path).st_dev == os.stat(self.mods_path.parent).st_dev
+        except OSError:
+            return False
+
+    def _recover_interrupted_swap(self):
+        """Finish a swap (install or rollback) the program stopped in the middle of"""
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                journal = json.load(f)
+        except FileNotFoundError:
+            journal = None
+        except Exception as e:
+            logger.error(f"Unreadable swap journal, ignoring it: {e}")
+            self.journal_path.unlink()
+            journal = None
+
+        if journal is not None:
+            logger.warning(f"Finishing interrupted {journal['operation']}")
+            moves = journal.get('moves')
+            if moves and journal['done'] == 0:
+                self._move_files(Path(moves['from']), Path(moves['to']), moves['names'])
+            for src, dst in journal['renames'][journal['done']:]:
+                # The first of these may have happened before the journal was updated
+                if os.path.lexists(src) and not os.path.lexists(dst):
+                    os.replace(src, dst)
+            self.journal_path.unlink()
+        elif not self.mods_path.exists() and self.previous_path.is_dir():
+            # Left by a version without journal, which tree the manifest describes is unknown
+            logger.warning("TheForest folder missing after interrupted install, restoring previous one")
+            os.rename(self.previous_path, self.mods_path)
+            self._remove_manifest()
+        self.reclaim_trash()
+
+    def reclaim_trash(self):
+        """Delete folders left aside by an earlier run, in the background"""
+        try:
+            trash = [path for path in self.mods_path.parent.iterdir() if path.name.startswith(TRASH_PREFIX)]
+        except OSError:
+            return
+        if trash:
+            logger.info(f"Reclaiming {len(trash)} old mods folders")
+            self._delete_in_background(trash)
+
+    def _discard_tree(self, path: Path):
+        """
+        Move a folder aside and delete it on a background thread.
+
+        The rename takes the same time no matter how many files the folder
+        holds, while deleting tens of thousands of small files can take
+        minutes on Windows with antivirus scanning. Trash the program exits
+        before deleting is reclaimed by reclaim_trash() on the next install.
+        If the folder cannot be renamed it is deleted in place.
+        """
+        trash_path = self.mods_path.parent / f"{TRASH_PREFIX}{uuid.uuid4().hex[:12]}"
+        try:
+            os.rename(path, trash_path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Cannot move {path.name} aside ({e}), deleting it now")
+            _delete_tree(path)
+            return
+        self._delete_in_background([trash_path])
+
+    @staticmethod
+    def _delete_in_background(paths):
+        with _trash_lock:
+            paths = [path for path in paths if path not in _trash_pending]
+            _trash_pending.update(paths)
+        if paths:
+            threading.Thread(target=_delete_trash, args=(paths,), name="TrashCleanup", daemon=True).start()
+
+    @staticmethod
+    def _file_record(info, base_path):
+        """Describe a freshly extracted archive entry for the manifest"""
+        try:
+            mtime = (base_path / info.filename).stat().st_mtime_ns
+        except OSError:
+            # Name was changed by extraction (e.g. unsafe path), never treat as unchanged
+            mtime = None
+        return {'size': info.file_size, 'crc': info.CRC, 'mtime': mtime}
+
+    @staticmethod
+    def _build_manifest(source, files):
+        """Build manifest for files installed from given source"""
+        return {
+            'version': MANIFEST_VERSION,
+            'source': source,
+            'installed_at': datetime.now().isoformat(),
+            'files': files
+        }
+
+    def _load_manifest(self, path=None):
+        """
+        Load manifest of the current install (or from given path).
+
+        Returns:
+            dict | None: Manifest, or None if missing or unreadable
+        """
+        try:
+            with open(path or self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != MANIFEST_VERSION:
+                logger.warning("Unsupported install manifest version, ignoring it")
+                return None
+            return manifest
+        except FileNotFoundError:
+            logger.debug("No install manifest found")
+        except Exception as e:
+            logger.warning(f"Failed to load install manifest: {e}")
+        return None
+
+    def _save_manifest(self, manifest, path=None):
+        """Write manifest of the current install (or to given path)"""
+        path = path or self.manifest_path
+        try:
+            # dumps() uses the C encoder, dump() encodes piece by piece in Python
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(manifest, separators=(',', ':')))
+            logger.debug("Install manifest saved: %s", path)
+        except Exception as e:
+            logger.error(f"Failed to save install manifest: {e}", exc_info=True)
+
+    def _remove_manifest(self, path=None):
+        """Forget the current (or given) install manifest"""
+        try:
+            (path or self.manifest_path).unlink()
+        except FileNotFoundError:
+            pass
 
     def _clear_mods(self):
-        """Remove all files from TheForest folder."""
-        logger.debug("Clearing mods folder")
-        for item in os.listdir(self.mods_path):
-            item_path = self.mods_path / item
-            if item_path.is_file():
-                item_path.unlink()
-                logger.debug(f"Removed file: {item}")
-            elif item_path.is_dir():
-                shutil.rmtree(item_path)
-                logger.debug(f"Removed directory: {item}")
+        """Remove all files from TheForest folder, deleting them in the background."""
+        with span("install.clear", folder=self.mods_path.name):
+            items = len(os.listdir(self.mods_path))
+            self._discard_tree(self.mods_path)
+            self.mods_path.mkdir(exist_ok=True)
+        logger.info(f"Cleared mods folder ({items} top-level items)")
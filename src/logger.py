@@ -1,7 +1,18 @@
 """
 src/logger.py - Logging system with colors and formatting
 """
+import atexit
+import gzip
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+import traceback
 from datetime import datetime
 from pathlib import Path
 
@@ -29,101 +40,582 @@ class CustomFormatter(logging.Formatter):
     """
     Formatter generating logs in format:
     timestamp[tab]<file[tab]function: line>
+
+    The timestamp text is reused for records from the same second, and the
+    location part is cached per logging call site.
     """
 
-    def format(self, record):
-        # Get timestamp in local timezone
-        timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+    LOCATION_CACHE_SIZE = 4096
 
-        # Extract filename from full path
-        filename = Path(record.pathname).name
+    def __init__(self):
+        super().__init__()
+        self._time_cache = (None, "")  # (second, formatted timestamp)
+        self._locations = {}
 
-        # Format according to requirements
-        location = f"<{filename}\t{record.funcName}: {record.lineno}>"
+    def format(self, record):
+        # Timestamp in local timezone; the time the record was created,
+        # it may be written a moment later by the log listener thread
+        second = int(record.created)
+        cached_second, timestamp = self._time_cache
+        if second != cached_second:
+            timestamp = time.strftime("%d-%m-%Y %H:%M:%S", time.localtime(second))
+            self._time_cache = (second, timestamp)
+
+        key = (record.pathname, record.funcName, record.lineno)
+        location = self._locations.get(key)
+        if location is None:
+            if len(self._locations) >= self.LOCATION_CACHE_SIZE:
+                self._locations.clear()
+            location = f"<{record.filename}\t{record.funcName}: {record.lineno}>"
+            self._locations[key] = location
 
         # Combine everything with tabs
-        prefix = f"{timestamp}\t{location}\t"
+        return f"{timestamp}\t{location}\t{record.getMessage()}"
 
-        # Add prefix to message
-        return f"{prefix}{record.getMessage()}"
 
+class _FileLock:
+    """
+    Exclusive lock on a file, shared between processes. The operating
+    system releases it when the process ends, even after a crash.
+    """
 
-def cleanup_old_logs(log_dir: Path, max_logs: int = 15):
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd = None
+
+    def acquire(self, blocking=True) -> bool:
+        """
+        Returns:
+            bool: True if locked, False if another process holds the lock
+                (only without blocking)
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if sys.platform == 'win32':
+                import msvcrt
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        if not blocking:
+                            raise
+                        time.sleep(0.05)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class LogSegments:
+    """
+    Finished log files of the logs folder, gzipped and pruned on a
+    background thread.
+
+    The folder keeps one plain active file per running process. Files that
+    are done (rotated parts, or the active file of a process that ended)
+    are compressed to .log.gz and listed in a small JSON index with their
+    size and creation time. Limits are checked against the index, without
+    scanning the folder: segments older than max_age_days go first, then
+    the oldest ones until all segments fit in max_total_bytes.
+
+    Several instances (the GUI and the command line) can share the folder.
+    Each process holds a lock on a .lock file next to its active log while
+    it runs, and a log is only compressed once its owner's lock is free.
+    The index is re-read and written under its own lock on every change,
+    so processes never overwrite each other's entries.
     """
-    Remove oldest log files if their count exceeds max_logs.
 
-    Args:
-        log_dir (Path): Path to logs folder
-        max_logs (int): Maximum number of log files to keep
+    INDEX_VERSION = 2
+
+    def __init__(self, log_dir: Path, active_file: Path, max_total_bytes: int, max_age_days: int):
+        """
+        Args:
+            log_dir (Path): Logs folder
+            active_file (Path): Log file written by this run
+            max_total_bytes (int): Space all compressed segments may take
+            max_age_days (int): Segments older than this are removed
+        """
+        self.log_dir = log_dir
+        self.index_file = log_dir / LOG_INDEX_FILE
+        self.active_file = active_file
+        self.max_total_bytes = max_total_bytes
+        self.max_age = max_age_days * 24 * 60 * 60
+        self._tasks = queue.Queue()
+
+        # Held until the process ends, marks the active log as in use
+        self._active_lock = _FileLock(self._lock_path(active_file.name))
+        self._active_lock.acquire(blocking=False)
+        self._index_lock = _FileLock(log_dir / f".{LOG_INDEX_FILE}.lock")
+
+        # Nothing here logs: it would feed back into the log handlers
+        self._thread = threading.Thread(target=self._run, name="LogSegments", daemon=True)
+        self._thread.start()
+        self._tasks.put((self._start, ()))
+
+    def add(self, path: Path):
+        """Queue a finished log file for compression"""
+        self._tasks.put((self._add, (path,)))
+
+    def _run(self):
+        while True:
+            func, args = self._tasks.get()
+            try:
+                func(*args)
+            except Exception:
+                traceback.print_exc()
+
+    def _lock_path(self, log_name: str) -> Path:
+        return self.log_dir / f".{log_name}.lock"
+
+    @staticmethod
+    def _owner(log_name: str) -> str:
+        """Active log a file belongs to: <stem>.<part>.log belongs to <stem>.log"""
+        stem, _, part = log_name[:-len('.log')].rpartition('.')
+        return f"{stem}.log" if stem and part.isdigit() else log_name
+
+    def _start(self):
+        """Pick up logs of processes that ended, register this one and enforce limits"""
+        own_name = self.active_file.name
+        with self._index_lock:
+            index = self._load_index()
+            if index is None:
+                # No usable index (first run or upgrade): adopt plain logs once
+                index = {
+                    'segments': [],
+                    'active': [path.name for path in self.log_dir.glob("*.log") if path != self.active_file]
+                }
+
+            owner_locks = {}
+
+            def is_closed(name):
+                owner = self._owner(name)
+                if owner == own_name:
+                    return False
+                if owner not in owner_locks:
+                    lock = _FileLock(self._lock_path(owner))
+                    owner_locks[owner] = lock if lock.acquire(blocking=False) else None
+                return owner_locks[owner] is not None
+
+            segments = []
+            for segment in index['segments']:
+                if segment['compressed'] or not is_closed(segment['name']):
+                    segments.append(segment)
+                else:
+                    # Compression interrupted by the end of its process
+                    segments.extend(self._adopt(segment['name']))
+
+            active = [own_name]
+            for name in index['active']:
+                if name == own_name:
+                    continue
+                if is_closed(name):
+                    segments.extend(self._adopt(name))
+                else:
+                    active.append(name)
+
+            index = {'segments': segments, 'active': active}
+            self._prune(index)
+            self._save(index)
+
+            for lock in owner_locks.values():
+                if lock is not None:
+                    lock.release()
+            self._remove_stale_locks(active)
+
+    def _remove_stale_locks(self, active: list):
+        """Delete lock files of processes that ended and whose logs were adopted"""
+        for path in self.log_dir.glob(".*.log.lock"):
+            if path.name[1:-len('.lock')] in active:
+                continue
+            lock = _FileLock(path)
+            if lock.acquire(blocking=False):
+                lock.release()
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def close(self):
+        """Release the active log when the process exits, after its last record"""
+        self._active_lock.release()
+        try:
+            self._active_lock.path.unlink()
+        except OSError:
+            pass
+
+    def _adopt(self, name: str) -> list:
+        """Compress a log left by a process that ended, return its segments"""
+        path = self.log_dir / name
+        if path.exists():
+            return [self._compress(path)]
+        target = path.with_name(path.name + '.gz')
+        if target.exists():
+            # Compressed, but the process ended before updating the index
+            stat = target.stat()
+            return [{'name': target.name, 'size': stat.st_size, 'created': stat.st_mtime, 'compressed': True}]
+        return []
+
+    def _add(self, path: Path):
+        """Compress a finished log file of this process and list it in the index"""
+        stat = path.stat()
+        pending = {'name': path.name, 'size': stat.st_size, 'created': stat.st_mtime, 'compressed': False}
+        with self._index_lock:
+            index = self._load_index() or {'segments': [], 'active': [self.active_file.name]}
+            index['segments'].append(pending)
+            self._save(index)
+
+        segment = self._compress(path)
+
+        with self._index_lock:
+            index = self._load_index() or {'segments': [], 'active': [self.active_file.name]}
+            index['segments'] = [s for s in index['segments'] if s['name'] != path.name]
+            index['segments'].append(segment)
+            self._prune(index)
+            self._save(index)
+
+    @staticmethod
+    def _compress(path: Path) -> dict:
+        """Gzip a log file next to itself and delete the original"""
+        created = path.stat().st_mtime
+        target = path.with_name(path.name + '.gz')
+        temp_path = path.with_name(f".{path.name}.gz.tmp")
+        with open(path, 'rb') as src, gzip.open(temp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(temp_path, target)
+        path.unlink()
+        return {'name': target.name, 'size': target.stat().st_size, 'created': created, 'compressed': True}
+
+    def _prune(self, index: dict):
+        """Remove segments over the age and size limits, oldest first"""
+        segments = sorted(index['segments'], key=lambda segment: segment['created'])
+        cutoff = time.time() - self.max_age
+        total = sum(segment['size'] for segment in segments if segment['compressed'])
+
+        keep = []
+        for segment in segments:
+            # Segments still being compressed belong to a running process
+            if segment['compressed'] and (segment['created'] < cutoff or total > self.max_total_bytes):
+                total -= segment['size']
+                try:
+                    (self.log_dir / segment['name']).unlink()
+                except FileNotFoundError:
+                    pass
+            else:
+                keep.append(segment)
+        index['segments'] = keep
+
+    def _load_index(self):
+        """
+        Returns:
+            dict | None: 'segments' and 'active' log names, None without a usable index
+        """
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == 1:
+                # Version 1 tracked a single active log
+                active = [index['active']] if index.get('active') else []
+            elif index.get('version') == self.INDEX_VERSION:
+                active = index['active']
+            else:
+                return None
+            return {'segments': index['segments'], 'active': active}
+        except Exception:
+            return None
+
+    def _save(self, index: dict):
+        data = {
+            'version': self.INDEX_VERSION,
+            'active': index['active'],
+            'segments': index['segments']
+        }
+        temp_path = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+        os.replace(temp_path, self.index_file)
+
+
+class RotatingLogHandler(logging.FileHandler):
     """
-    # Find all .log files
-    log_files = list(log_dir.glob("*.log"))
+    Log file handler that starts a new part once the file reaches max_bytes.
 
-    # If there are more files than max_logs
-    if len(log_files) > max_logs:
-        # Sort by modification time (oldest first)
-        log_files.sort(key=lambda x: x.stat().st_mtime)
+    The full file is renamed to <name>.<part>.log and handed to LogSegments
+    for compression, then logging continues in a fresh file under the
+    original name, so the active log file path never changes.
+    """
 
-        # Remove excess files (oldest ones)
-        files_to_remove = len(log_files) - max_logs
-        for i in range(files_to_remove):
-            log_files[i].unlink()
+    def __init__(self, path: Path, max_bytes: int, segments: LogSegments):
+        super().__init__(path, encoding='utf-8')
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.segments = segments
+        self._part = 0
+
+    def emit(self, record):
+        try:
+            if self.stream is not None and self.stream.tell() >= self.max_bytes:
+                self._rollover()
+        except Exception:
+            self.handleError(record)
+        super().emit(record)
+
+    def _rollover(self):
+        self.stream.close()
+        self.stream = None
+        try:
+            self._part += 1
+            part = self.path.with_name(f"{self.path.stem}.{self._part}.log")
+            os.replace(self.path, part)
+            self.segments.add(part)
+        finally:
+            # Keeps writing to the old file if it could not be renamed
+            self.stream = self._open()
+
+
+APP_LOGGER_NAME = "ForestModManager"
+LOG_DIR = Path.home() / '.forest_mod_manager' / 'logs'
+LOG_INDEX_FILE = 'segments.json'
+LOG_LEVEL_ENV = 'FOREST_MOD_MANAGER_LOG_LEVEL'  # Overrides the default level, e.g. DEBUG
+
+# Log rotation limits
+MAX_LOG_BYTES = 5 * 1024 * 1024  # Size of one log file before a new part starts
+MAX_TOTAL_LOG_BYTES = 50 * 1024 * 1024  # Space for compressed older logs
+MAX_LOG_AGE_DAYS = 14
+
+# Write logs on a background thread, so slow disks don't stall the UI
+ASYNC_LOGGING = True
+LOG_QUEUE_SIZE = 10000  # Records waiting to be written before new ones are dropped
+
+# Color configuration with WTF
+LEVEL_STYLES = {
+    'debug': {'color': 'cyan'},
+    'info': {'color': 'green'},
+    'warning': {'color': 'yellow'},
+    'error': {'color': 'red'},
+    'critical': {'color': 'red', 'bold': True},
+    'wtf': {'color': 'magenta', 'bold': True, 'background': 'black'}
+}
+
+
+def _default_level() -> int:
+    """
+    INFO for built executables, DEBUG when running from source.
+    Debug calls below the level return right away without formatting.
+    """
+    name = os.environ.get(LOG_LEVEL_ENV)
+    if name:
+        level = logging.getLevelName(name.upper())
+        if isinstance(level, int):
+            return level
+    return logging.INFO if getattr(sys, 'frozen', False) else logging.DEBUG
+
+
+LOG_LEVEL = _default_level()
 
+_setup_lock = threading.Lock()
+_log_file = None
+_console_level = logging.DEBUG  # Lowest level printed, see set_console_level()
+_queue_handler = None
+_listener = None
 
-def setup_logger(name="ForestModManager"):
+# Message arguments of these types cannot change before the record is written
+_IMMUTABLE_ARGS = (str, int, float, bool, bytes, type(None), Path)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
     """
-    Configure and return logger with colors and custom formatting.
+    Puts records on a bounded queue for a QueueListener.
 
-    Args:
-        name (str): Logger name
+    Unlike QueueHandler, messages are not formatted on the logging thread,
+    and records that don't fit in the queue are dropped and counted instead
+    of raising errors. The number of dropped records is logged once the
+    queue is half empty again.
+    """
 
-    Returns:
-        logging.Logger: Configured logger
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0  # Total dropped records
+        self.unreported = 0
+
+    def prepare(self, record):
+        # Mutable arguments are formatted now, as they may change before
+        # the listener gets to the record
+        args = record.args
+        if args and (isinstance(args, dict)
+                     or not all(isinstance(value, _IMMUTABLE_ARGS) for value in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            # Report drops once the queue drained, not on every free slot
+            if self.unreported and self.queue.qsize() < self.queue.maxsize // 2:
+                self.queue.put_nowait(self.dropped_record())
+                self.unreported = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self.unreported += 1
+
+    def dropped_record(self):
+        """Record reporting drops not logged yet"""
+        return logging.LogRecord(
+            APP_LOGGER_NAME, logging.WARNING, __file__, 0,
+            "Log queue full, %d records dropped", (self.unreported,), None,
+            func="enqueue"
+        )
+
+
+def _configure_app_logger():
     """
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    Attach the file and console handlers to the application logger.
+    Runs once per process, module loggers are its children and reuse them.
+    """
+    global _log_file
+    logger = logging.getLogger(APP_LOGGER_NAME)
 
     # Clear existing handlers
     logger.handlers = []
 
     # Prepare logs folder
-    log_dir = Path.home() / '.forest_mod_manager' / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # Remove old logs if there are too many
-    cleanup_old_logs(log_dir)
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     # Create new log file with timestamp
+    # Process id keeps names unique when instances start in the same second
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = log_dir / f"mod_manager_{timestamp}.log"
+    _log_file = LOG_DIR / f"mod_manager_{timestamp}_{os.getpid()}.log"
+
+    # Older logs are compressed and pruned in the background
+    segments = LogSegments(LOG_DIR, _log_file, MAX_TOTAL_LOG_BYTES, MAX_LOG_AGE_DAYS)
+    # Registered first, so it runs after the log listener was stopped
+    atexit.register(segments.close)
 
     # File handler
-    fh = logging.FileHandler(log_file, encoding='utf-8')
+    fh = RotatingLogHandler(_log_file, MAX_LOG_BYTES, segments)
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(CustomFormatter())
     logger.addHandler(fh)
 
-    # Color configuration with WTF
-    LEVEL_STYLES = {
-        'debug': {'color': 'cyan'},
-        'info': {'color': 'green'},
-        'warning': {'color': 'yellow'},
-        'error': {'color': 'red'},
-        'critical': {'color': 'red', 'bold': True},
-        'wtf': {'color': 'magenta', 'bold': True, 'background': 'black'}
-    }
-
     # Console handler with colors
     coloredlogs.install(
-        level='DEBUG',
+        level=_console_level,
         logger=logger,
         fmt='%(asctime)s\t<%(filename)s\t%(funcName)s: %(lineno)d>\t%(message)s',
         datefmt='%d-%m-%Y %H:%M:%S',
         level_styles=LEVEL_STYLES
     )
+    # After coloredlogs, which lowers the logger level to its handler's
+    logger.setLevel(LOG_LEVEL)
+
+    if ASYNC_LOGGING:
+        _start_listener(logger)
+
+
+class _LogListener(logging.handlers.QueueListener):
+    """QueueListener that waits for room in a full queue when stopping"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+def _start_listener(logger):
+    """Move the logger's handlers behind a queue served by a background thread"""
+    global _queue_handler, _listener
+    handlers = logger.handlers
+    _queue_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    logger.handlers = [_queue_handler]
+
+    _listener = _LogListener(
+        _queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_stop_listener)
+
+
+def _stop_listener():
+    """Write out what is still queued when the program exits"""
+    if _queue_handler.unreported:
+        _queue_handler.queue.put(_queue_handler.dropped_record())
+    _listener.stop()
+
+
+def set_console_level(level: int):
+    """
+    Change what is printed to the console; the log file still gets
+    everything allowed by LOG_LEVEL. Called before the first logger is
+    set up, it also hides messages logged while modules are imported.
+
+    Args:
+        level (int): Lowest level shown on the console, e.g. logging.WARNING
+    """
+    global _console_level
+    with _setup_lock:
+        _console_level = level
+        if _log_file is None:
+            # Applied when the console handler is created
+            return
+    handlers = _listener.handlers if _listener else logging.getLogger(APP_LOGGER_NAME).handlers
+    for handler in handlers:
+        if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
+            handler.setLevel(level)
+
+
+def get_dropped_records() -> int:
+    """
+    Returns:
+        int: Number of log records dropped because the log queue was full
+    """
+    return _queue_handler.dropped if _queue_handler else 0
+
+
+def get_log_file():
+    """
+    Returns:
+        Path | None: Log file of this run, None before logging is set up
+    """
+    return _log_file
+
+
+def setup_logger(name=APP_LOGGER_NAME):
+    """
+    Return logger with colors and custom formatting.
+
+    The first call sets up the log file and console output for the whole
+    process. Other names get child loggers of the application logger, which
+    write through the same handlers.
+
+    Args:
+        name (str): Logger name
+
+    Returns:
+        logging.Logger: Configured logger
+    """
+    if _log_file is None:
+        with _setup_lock:
+            if _log_file is None:
+                _configure_app_logger()
 
-    return logger
+    if name == APP_LOGGER_NAME:
+        return logging.getLogger(APP_LOGGER_NAME)
+    return logging.getLogger(f"{APP_LOGGER_NAME}.{name}")
 
 
 # Usage example:
@@ -138,8 +630,5 @@ if __name__ == "__main__":
     logger.wtf("How did this even happen?! 😱")
 
     # Show logs folder
-    log_dir = Path.home() / '.forest_mod_manager' / 'logs'
-    print("\nLogs folder:", log_dir)
-    print("Current log files:")
-    for log_file in sorted(log_dir.glob("*.log")):
-        print(f"- {log_file.name}")
+    print("\nLogs folder:", LOG_DIR)
+    print("Current log file:", get_log_file())
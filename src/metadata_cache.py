@@ -0,0 +1,151 @@
+"""
+src/metadata_cache.py - Persistent cache of saved mod metadata
+"""
+import json
+import os
+import threading
+import uuid
+import zipfile
+from pathlib import Path
+from typing import Callable, Optional
+
+from .logger import setup_logger
+from .mod_store import hash_file
+from .profiling import span
+
+logger = setup_logger("MetadataCache")
+
+CACHE_FILE = Path.home() / '.forest_mod_manager' / 'metadata_cache.json'
+CACHE_VERSION = 1
+
+
+def scan_zip(path: Path) -> dict:
+    """
+    Read metadata from ZIP central directory.
+
+    Returns:
+        dict: entry_count, uncompressed_size and top_level folders/files
+    """
+    with zipfile.ZipFile(path, 'r') as zip_ref:
+        infos = zip_ref.infolist()
+    return {
+        'entry_count': len(infos),
+        'uncompressed_size': sum(info.file_size for info in infos),
+        'top_level': sorted({info.filename.split('/', 1)[0] for info in infos})
+    }
+
+
+def scan_index(path: Path) -> dict:
+    """
+    Read metadata from a file store index.
+
+    Returns:
+        dict: entry_count, uncompressed_size and top_level folders/files
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    names = list(index['files']) + index['dirs']
+    return {
+        'entry_count': len(names),
+        'uncompressed_size': sum(record['size'] for record in index['files'].values()),
+        'top_level': sorted({name.split('/', 1)[0] for name in names})
+    }
+
+
+class MetadataCache:
+    """
+    Metadata of saved mods, keyed by path and validated by size and
+    modification time, so archives are only opened when they changed.
+    Safe to use from several threads.
+    """
+
+    def __init__(self, cache_file: Path = CACHE_FILE):
+        self.cache_file = cache_file
+        self._entries = self._load()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                return data['entries']
+            logger.info("Metadata cache version changed, rebuilding")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load metadata cache: {e}")
+        return {}
+
+    def get(self, path: Path, digest: Optional[str] = None,
+            scanner: Callable[[Path], dict] = scan_zip) -> Optional[dict]:
+        """
+        Get metadata of a mod file, scanning it only if it changed.
+
+        Args:
+            path (Path): Stored archive or file store index
+            digest (str): Content hash, if already known
+            scanner (callable): Reads metadata from the file on cache miss
+
+        Returns:
+            dict | None: entry_count, uncompressed_size, top_level and hash,
+                or None if the file cannot be read
+        """
+        key = str(path)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            logger.warning(f"Cannot stat mod file {path}: {e}")
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            if digest is None or entry['hash'] == digest:
+                return entry
+
+        logger.debug("Scanning mod file metadata: %s", path)
+        try:
+            with span("zip.scan", path=os.path.basename(path), hashed=digest is None):
+                entry = scanner(path)
+                entry['hash'] = digest or hash_file(path)
+        except Exception as e:
+            logger.error(f"Failed to read mod file {path}: {e}")
+            return None
+
+        entry['size'] = stat.st_size
+        entry['mtime'] = stat.st_mtime_ns
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+        return entry
+
+    def retain(self, paths):
+        """Forget entries of files not in paths"""
+        keep = {str(path) for path in paths}
+        with self._lock:
+            for key in list(self._entries):
+                if key not in keep:
+                    del self._entries[key]
+                    self._dirty = True
+
+    def save(self):
+        """Write cache to disk if anything changed"""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        if not self._dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_file.with_name(f".{uuid.uuid4().hex}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'entries': self._entries}, f,
+                          separators=(',', ':'))
+            os.replace(temp_path, self.cache_file)
+            self._dirty = False
+            logger.debug("Metadata cache saved: %s entries", len(self._entries))
+        except Exception as e:
+            logger.error(f"Failed to save metadata cache: {e}", exc_info=True)
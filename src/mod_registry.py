@@ -0,0 +1,229 @@
+"""
+src/mod_registry.py - Registry of saved mods
+"""
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+from .logger import setup_logger
+
+logger = setup_logger("ModRegistry")
+
+REGISTRY_DB = Path.home() / '.forest_mod_manager' / 'mods.db'
+SQLITE_THRESHOLD = 500  # Saved mods kept in the JSON config before moving to SQLite
+
+
+def migrate_saved_mods(saved_mods) -> Dict[str, dict]:
+    """
+    Convert saved mods from the old list format to records keyed by filename.
+
+    Old entries look like {'filename', 'hash', 'storage', 'source': {'path',
+    'size', 'mtime'}}, or just {'filename'} for versions before the store.
+
+    Args:
+        saved_mods (list | dict): Value of 'saved_mods' from the config
+
+    Returns:
+        dict: filename -> record
+    """
+    if isinstance(saved_mods, dict):
+        return saved_mods
+
+    records = {}
+    for mod_info in saved_mods:
+        record = {'filename': mod_info['filename'], 'added': None, 'install_count': 0}
+        for key in ('hash', 'storage'):
+            if key in mod_info:
+                record[key] = mod_info[key]
+        source = mod_info.get('source')
+        if source:
+            record.update(source=source['path'], size=source['size'], mtime=source['mtime'])
+        # Later duplicates replaced earlier ones when the list was in use
+        records[record['filename']] = record
+    logger.info(f"Migrated {len(records)} saved mods to keyed registry")
+    return records
+
+
+class SqliteRegistryStore:
+    """
+    Keeps registry records in an SQLite file, so a change writes one row
+    instead of the whole list. Changes are committed by commit().
+    """
+
+    def __init__(self, db_path: Path = REGISTRY_DB):
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Commits run on the config's flush thread
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS mods ("
+                "filename TEXT PRIMARY KEY, hash TEXT, data TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS mods_hash ON mods (hash)")
+            self._conn.commit()
+
+    def load(self) -> Dict[str, dict]:
+        """Read all records, in the order they were added"""
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM mods ORDER BY rowid").fetchall()
+        records = {}
+        for (data,) in rows:
+            record = json.loads(data)
+            records[record['filename']] = record
+        return records
+
+    def put(self, record: dict):
+        """Insert or update a record, keeping its position"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO mods (filename, hash, data) VALUES (?, ?, ?) "
+                "ON CONFLICT(filename) DO UPDATE SET hash = excluded.hash, data = excluded.data",
+                (record['filename'], record.get('hash'), json.dumps(record, separators=(',', ':')))
+            )
+
+    def delete(self, filename: str):
+        """Delete record with given filename"""
+        with self._lock:
+            self._conn.execute("DELETE FROM mods WHERE filename = ?", (filename,))
+
+    def commit(self):
+        """Write pending changes"""
+        with self._lock:
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+class ModRegistry:
+    """
+    Saved mods keyed by filename, with indexes by content hash and by the
+    source file they were added from, so lookups do not scan every mod.
+
+    Records are dicts: filename, hash, storage, source (path of the added
+    file), size and mtime (of the added file), added (ISO date) and
+    install_count. Small registries live in the JSON config; large ones
+    in an SQLite file, see SqliteRegistryStore.
+    """
+
+    def __init__(self, records: Dict[str, dict], on_change: Callable[[], None],
+                 db_store: Optional[SqliteRegistryStore] = None):
+        """
+        Args:
+            records (dict): filename -> record; kept in sync in place when
+                the registry lives in the JSON config
+            on_change (callable): Called after every change, schedules saving
+            db_store (SqliteRegistryStore): Row store, if the registry lives in SQLite
+        """
+        self._records = records
+        self._on_change = on_change
+        self.db_store = db_store
+        self._by_hash: Dict[str, set] = {}
+        self._by_source: Dict[tuple, str] = {}
+        for record in records.values():
+            self._index(record)
+
+    @staticmethod
+    def _source_key(record: dict) -> Optional[tuple]:
+        if record.get('source') is None:
+            return None
+        return record['source'], record.get('size'), record.get('mtime')
+
+    def _index(self, record: dict):
+        if record.get('hash'):
+            self._by_hash.setdefault(record['hash'], set()).add(record['filename'])
+        key = self._source_key(record)
+        if key is not None:
+            self._by_source[key] = record['filename']
+
+    def _unindex(self, record: dict):
+        users = self._by_hash.get(record.get('hash'))
+        if users is not None:
+            users.discard(record['filename'])
+            if not users:
+                del self._by_hash[record['hash']]
+        key = self._source_key(record)
+        if key is not None and self._by_source.get(key) == record['filename']:
+            del self._by_source[key]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self._records
+
+    def __iter__(self) -> Iterator[dict]:
+        """Records in the order they were added"""
+        return iter(list(self._records.values()))
+
+    def get(self, filename: str) -> Optional[dict]:
+        """Get record with given filename"""
+        return self._records.get(filename)
+
+    def find_by_source(self, path: str, size: int, mtime: int) -> Optional[dict]:
+        """Get record added from given file, if the file did not change since"""
+        filename = self._by_source.get((path, size, mtime))
+        return self._records.get(filename) if filename else None
+
+    def is_used(self, digest: str) -> bool:
+        """Check if any saved mod refers to content with given hash"""
+        return bool(self._by_hash.get(digest))
+
+    def put(self, record: dict):
+        """Add a record or replace the one with the same filename"""
+        old = self._records.get(record['filename'])
+        if old is not None:
+            self._unindex(old)
+        self._records[record['filename']] = record
+        self._index(record)
+        if self.db_store:
+            self.db_store.put(record)
+        self._on_change()
+
+    def update(self, filename: str, **changes):
+        """Change fields of a record"""
+        record = dict(self._records[filename], **changes)
+        self.put(record)
+
+    def remove(self, filename: str) -> Optional[dict]:
+        """
+        Remove record with given filename.
+
+        Returns:
+            dict | None: Removed record
+        """
+        record = self._records.pop(filename, None)
+        if record is None:
+            return None
+        self._unindex(record)
+        if self.db_store:
+            self.db_store.delete(filename)
+        self._on_change()
+        return record
+
+    def record_install(self, filename: str):
+        """Count a successful install of a mod"""
+        record = self._records.get(filename)
+        if record is not None:
+            self.update(filename, install_count=record.get('install_count', 0) + 1)
+
+    def move_to_sqlite(self, db_store: SqliteRegistryStore):
+        """Copy all records into an SQLite store and keep them there from now on"""
+        for record in self._records.values():
+            db_store.put(record)
+        db_store.commit()
+        # Detach from the config's dict, it is emptied by the caller
+        self._records = dict(self._records)
+        self.db_store = db_store
+        logger.info(f"Moved {len(self._records)} saved mods to {db_store.db_path}")
+
+    def commit(self):
+        """Write pending SQLite changes, nothing to do for the JSON config"""
+        if self.db_store:
+            self.db_store.commit()
@@ -0,0 +1,248 @@
+"""
+src/mod_store.py - Content-addressed storage of saved mods
+"""
+import hashlib
+import json
+import os
+import shutil
+import uuid
+import zipfile
+from pathlib import Path
+
+from .logger import setup_logger
+
+logger = setup_logger("ModStore")
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """
+    Calculate SHA-256 of a file.
+
+    Args:
+        path (Path): File to hash
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModStore:
+    """
+    Stores mod archives as blobs named after their SHA-256 hash,
+    so identical archives are kept on disk only once.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Args:
+            root (Path): Folder holding the blobs
+        """
+        self.root = Path(root)
+
+    def blob_path(self, digest: str) -> Path:
+        """Path of the blob with given hash"""
+        return self.root / f"{digest}.zip"
+
+    def has(self, digest: str) -> bool:
+        """Check if blob with given hash is stored"""
+        return self.blob_path(digest).exists()
+
+    def add(self, source: Path, digest: str = None) -> str:
+        """
+        Store a copy of an archive, unless identical content is already stored.
+
+        Args:
+            source (Path): Archive to store
+            digest (str): Hash of the archive, if already known
+
+        Returns:
+            str: Hash of the stored archive
+        """
+        if digest is None:
+            digest = hash_file(source)
+
+        target = self.blob_path(digest)
+        if target.exists():
+            logger.info(f"Archive already stored as {target.name}, skipping copy")
+            return digest
+
+        # Copy under a temporary name first, so a blob is never half written
+        temp_path = self.root / f".{uuid.uuid4().hex}.tmp"
+        try:
+            shutil.copy2(source, temp_path)
+            os.replace(temp_path, target)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Stored archive {source.name} as {target.name}")
+        return digest
+
+    def adopt(self, path: Path) -> str:
+        """
+        Move an archive that is already on the store's drive into the store.
+
+        Args:
+            path (Path): Archive to move
+
+        Returns:
+            str: Hash of the stored archive
+        """
+        digest = hash_file(path)
+        target = self.blob_path(digest)
+        if target.exists():
+            path.unlink()
+        else:
+            os.replace(path, target)
+        logger.info(f"Moved {path.name} into store as {target.name}")
+        return digest
+
+    def remove(self, digest: str):
+        """Delete blob with given hash"""
+        blob = self.blob_path(digest)
+        if blob.exists():
+            blob.unlink()
+            logger.info(f"Removed stored archive: {blob.name}")
+
+
+class FileStore:
+    """
+    Stores the files of unpacked mod archives by content hash.
+
+    Each saved archive gets a small index (archive hash -> list of files
+    with their blob hash, size and CRC32), so files shared between
+    archives are stored once and installs copy plain files instead of
+    decompressing.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Args:
+            root (Path): Folder holding file blobs and archive indexes
+        """
+        self.root = Path(root)
+        self.files_dir = self.root / 'files'
+        self.indexes_dir = self.root / 'indexes'
+
+    def blob_path(self, digest: str) -> Path:
+        """Path of the file blob with given hash"""
+        return self.files_dir / digest[:2] / digest
+
+    def index_path(self, archive_digest: str) -> Path:
+        """Path of the index of an archive"""
+        return self.indexes_dir / f"{archive_digest}.json"
+
+    def has_index(self, archive_digest: str) -> bool:
+        """Check if archive with given hash is unpacked in the store"""
+        return self.index_path(archive_digest).exists()
+
+    def load_index(self, archive_digest: str) -> dict:
+        """
+        Load index of an unpacked archive.
+
+        Returns:
+            dict: 'files' mapping archive names to {'hash', 'size', 'crc'},
+                and 'dirs' listing folder entries
+        """
+        with open(self.index_path(archive_digest), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def open_blob(self, digest: str):
+        """Open file blob for reading"""
+        return open(self.blob_path(digest), 'rb')
+
+    def import_archive(self, zip_path: Path, archive_digest: str) -> dict:
+        """
+        Unpack archive into the store and write its index.
+
+        Args:
+            zip_path (Path): Archive to unpack
+            archive_digest (str): Hash of the archive, used as index name
+
+        Returns:
+            dict: Index of the archive
+        """
+        self.files_dir.mkdir(parents=True, exist_ok=True)
+        self.indexes_dir.mkdir(parents=True, exist_ok=True)
+
+        files = {}
+        dirs = []
+        new_blobs = 0
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    dirs.append(info.filename)
+                    continue
+                digest, created = self._store_entry(zip_ref, info)
+                files[info.filename] = {'hash': digest, 'size': info.file_size, 'crc': info.CRC}
+                new_blobs += created
+
+        index = {'files': files, 'dirs': dirs}
+        temp_path = self.indexes_dir / f".{uuid.uuid4().hex}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+        os.replace(temp_path, self.index_path(archive_digest))
+
+        logger.info(f"Unpacked {zip_path.name} into file store: {len(files)} files, "
+                    f"{new_blobs} new, {len(files) - new_blobs} shared")
+        return index
+
+    def _store_entry(self, zip_ref, info):
+        """
+        Store one archive entry as a blob.
+
+        Returns:
+            tuple: (blob hash, True if the blob was new)
+        """
+        digest = hashlib.sha256()
+        temp_path = self.files_dir / f".{uuid.uuid4().hex}.tmp"
+        try:
+            with zip_ref.open(info) as src, open(temp_path, 'wb') as dst:
+                while True:
+                    chunk = src.read(HASH_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    dst.write(chunk)
+
+            blob = self.blob_path(digest.hexdigest())
+            if blob.exists():
+                temp_path.unlink()
+                return digest.hexdigest(), False
+
+            blob.parent.mkdir(exist_ok=True)
+            os.replace(temp_path, blob)
+            return digest.hexdigest(), True
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def remove_index(self, archive_digest: str):
+        """Delete index of an archive and the blobs no other index uses"""
+        index_path = self.index_path(archive_digest)
+        if not index_path.exists():
+            return
+
+        unused = {record['hash'] for record in self.load_index(archive_digest)['files'].values()}
+        index_path.unlink()
+
+        for other in self.indexes_dir.glob("*.json"):
+            with open(other, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            unused.difference_update(record['hash'] for record in index['files'].values())
+            if not unused:
+                break
+
+        for digest in unused:
+            self.blob_path(digest).unlink(missing_ok=True)
+        logger.info(f"Removed unpacked archive {archive_digest}, {len(unused)} files freed")
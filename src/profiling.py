@@ -0,0 +1,176 @@
+"""
+src/profiling.py - Timing spans and optional cProfile capture
+
+Spans time slow operations (install phases, config saves, ZIP scans,
+update checks). They are only recorded when FOREST_MOD_MANAGER_TRACE is
+set (or after enable_tracing()); otherwise span() returns a shared no-op
+context manager. Recorded spans are written to the logs folder as a
+Chrome trace when the program exits; open it in chrome://tracing or
+https://ui.perfetto.dev.
+
+Setting FOREST_MOD_MANAGER_PROFILE profiles the main thread with cProfile
+and writes a .prof file to the logs folder at exit, for snakeviz or
+python -m pstats.
+
+Usage:
+    with span("install.extract", files=len(entries)):
+        ...
+"""
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Optional
+
+from .logger import setup_logger, LOG_DIR
+
+logger = setup_logger("Profiling")
+
+TRACE_ENV = "FOREST_MOD_MANAGER_TRACE"
+PROFILE_ENV = "FOREST_MOD_MANAGER_PROFILE"
+MAX_TRACE_EVENTS = 100000  # Oldest spans are dropped beyond this
+
+# (name, start ns, duration ns, thread id, args) of finished spans
+_events = deque(maxlen=MAX_TRACE_EVENTS)
+_thread_names = {}
+_enabled = False
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter_ns() - self.start
+        thread = threading.current_thread()
+        _thread_names[thread.ident] = thread.name
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        _events.append((self.name, self.start, duration, thread.ident, self.args))
+        return False
+
+
+def span(name: str, **args):
+    """
+    Time a block of code.
+
+    Args:
+        name (str): Span name, dotted by area (e.g. 'install.extract')
+        **args: Details shown with the span in the trace viewer
+
+    Returns:
+        Context manager, a no-op if tracing is disabled
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name: str):
+    """Decorator timing every call of a function as a span"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable_tracing():
+    """Start recording spans, they are written to the logs folder at exit"""
+    global _enabled
+    if not _enabled:
+        _enabled = True
+        atexit.register(dump_trace)
+        logger.info("Tracing enabled")
+
+
+def is_tracing() -> bool:
+    return _enabled
+
+
+def dump_trace(path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Write recorded spans as a Chrome trace (JSON).
+
+    Args:
+        path (Path): Output file, default is a new file in the logs folder
+
+    Returns:
+        Path | None: Written file, None if there was nothing to write
+    """
+    events = list(_events)
+    if not events:
+        return None
+
+    pid = os.getpid()
+    trace = [
+        {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+        for tid, name in list(_thread_names.items())
+    ]
+    for name, start, duration, tid, args in events:
+        trace.append({
+            'name': name,
+            'cat': name.split('.')[0],
+            'ph': 'X',
+            'ts': start / 1000,
+            'dur': duration / 1000,
+            'pid': pid,
+            'tid': tid,
+            'args': args
+        })
+
+    if path is None:
+        path = LOG_DIR / f"trace_{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+    except Exception as e:
+        logger.error(f"Failed to write trace: {e}")
+        return None
+    logger.info(f"Trace with {len(events)} spans written to {path}")
+    return path
+
+
+def _start_profiler():
+    """Profile the main thread until exit"""
+    import cProfile
+
+    profiler = cProfile.Profile()
+
+    def stop():
+        profiler.disable()
+        path = LOG_DIR / f"profile_{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}.prof"
+        try:
+            profiler.dump_stats(path)
+            logger.info(f"Profile written to {path}")
+        except Exception as e:
+            logger.error(f"Failed to write profile: {e}")
+
+    atexit.register(stop)
+    profiler.enable()
+    logger.info("cProfile enabled")
+
+
+if os.environ.get(TRACE_ENV):
+    enable_tracing()
+if os.environ.get(PROFILE_ENV):
+    _start_profiler()
@@ -1,22 +1,30 @@
 """
 src/update_checker.py - Update checking system
 """
-import urllib.request
 import json
-from datetime import datetime, timedelta
-import webbrowser
-from typing import Optional, Tuple
-import customtkinter as ctk
+import os
+import time
+import urllib.error
+import urllib.request
+import uuid
+from pathlib import Path
+from typing import Optional
 
-from . import setup_logger
-from .components.ui import Colors
 from .config import CURRENT_VERSION
-from .i18n import _
+from .logger import setup_logger
+from .profiling import traced
 
-logger = setup_logger()
+logger = setup_logger("UpdateChecker")
 
 GITHUB_API_URL = "https://api.github.com/repos/philornot/EasyModAPI/releases"
 GITHUB_RELEASE_URL = "https://github.com/philornot/EasyModAPI/releases"
+RELEASE_CACHE_FILE = Path.home() / '.forest_mod_manager' / 'update_cache.json'
+RELEASE_CACHE_VERSION = 1
+UPDATE_TIMEOUT = 10  # Seconds before giving up on GitHub
+UPDATE_INTERVAL_HOURS = 24  # Default time between release list refreshes
+
+# Fields kept from each release of the GitHub API response
+RELEASE_FIELDS = ('tag_name', 'name', 'prerelease', 'body', 'html_url', 'published_at')
 
 
 def parse_version(version: str) -> tuple:
@@ -24,94 +32,166 @@ def parse_version(version: str) -> tuple:
     return tuple(map(int, version.lstrip('v').split('.')))
 
 
-def check_for_updates() -> Optional[str]:
+def find_latest_release(releases: list) -> Optional[dict]:
+    """
+    Find newest stable release.
+
+    Args:
+        releases (list): Releases from GitHub API
+
+    Returns:
+        dict | None: Newest release that is not a prerelease
     """
-    Check latest version on GitHub.
-    Returns new version number if available, None if not.
+    newest = None
+    newest_version = None
+    for release in releases:
+        if release.get('prerelease', False):  # Ignore prereleases
+            continue
+        try:
+            version = parse_version(release['tag_name'])
+        except ValueError:
+            logger.debug("Skipping release with unusual tag: %s", release.get('tag_name'))
+            continue
+        if newest_version is None or version > newest_version:
+            newest, newest_version = release, version
+    return newest
+
+
+class ReleaseCache:
     """
-    try:
-        # Get releases list
-        req = urllib.request.Request(
-            GITHUB_API_URL,
-            headers={'Accept': 'application/vnd.github.v3+json'}
-        )
-        with urllib.request.urlopen(req) as response:
-            releases = json.loads(response.read())
-
-        # Find latest stable release
-        current_version = parse_version(CURRENT_VERSION)
-        newest_version = None
-
-        for release in releases:
-            if not release.get('prerelease', False):  # Ignore prereleases
-                version = parse_version(release['tag_name'])
-                if version > current_version:
-                    if newest_version is None or version > newest_version:
-                        newest_version = version
-
-        if newest_version:
-            return f"v{'.'.join(map(str, newest_version))}"
+    Release list of the last GitHub response, kept on disk with its ETag,
+    Last-Modified and the time it was checked, so update checks and release
+    notes work without a request until the cache is due for a refresh.
+    """
+
+    def __init__(self, path: Path = RELEASE_CACHE_FILE):
+        self.path = path
+        self.endpoint = None
+        self.etag = None
+        self.last_modified = None
+        self.checked_at = 0.0  # Time of last successful request (200 or 304)
+        self.releases = []
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != RELEASE_CACHE_VERSION:
+                return
+            self.endpoint = data['endpoint']
+            self.etag = data.get('etag')
+            self.last_modified = data.get('last_modified')
+            self.checked_at = data['checked_at']
+            self.releases = data['releases']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load release cache: {e}")
+
+    def save(self):
+        """Write cache to disk"""
+        data = {
+            'version': RELEASE_CACHE_VERSION,
+            'endpoint': self.endpoint,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'checked_at': self.checked_at,
+            'releases': self.releases
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f".{uuid.uuid4().hex}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save release cache: {e}")
+
+    def is_fresh(self, endpoint: str, interval_hours: float) -> bool:
+        """Check if cached releases of endpoint are recent enough to skip a request"""
+        return (self.endpoint == endpoint
+                and time.time() - self.checked_at < interval_hours * 60 * 60)
+
+    @traced("update.check")
+    def refresh(self, endpoint: str, timeout: float = UPDATE_TIMEOUT):
+        """
+        Download release list, unless it did not change since last time.
+
+        The ETag and Last-Modified of the cached response are sent back;
+        if nothing changed the server answers 304 Not Modified and only the
+        check time is updated, without downloading or parsing the list.
+        Blocks for up to timeout seconds per network operation, so call it
+        off the Tk thread.
+
+        Raises:
+            Exception: If the request fails
+        """
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+        if self.endpoint == endpoint:
+            if self.etag:
+                headers['If-None-Match'] = self.etag
+            if self.last_modified:
+                headers['If-Modified-Since'] = self.last_modified
+
+        req = urllib.request.Request(endpoint, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                releases = json.loads(response.read())
+                self.etag = response.headers.get('ETag')
+                self.last_modified = response.headers.get('Last-Modified')
+            self.releases = [
+                {field: release.get(field) for field in RELEASE_FIELDS}
+                for release in releases
+            ]
+            self.endpoint = endpoint
+            logger.info(f"Release list downloaded: {len(self.releases)} releases")
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            logger.info("Releases not modified since last check")
+
+        self.checked_at = time.time()
+        self.save()
+
+    def find_update(self) -> Optional[dict]:
+        """
+        Returns:
+            dict | None: Newest cached stable release, if newer than this program
+        """
+        latest = find_latest_release(self.releases)
+        if latest and parse_version(latest['tag_name']) > parse_version(CURRENT_VERSION):
+            return latest
         return None
 
+    def get_release(self, tag: str) -> Optional[dict]:
+        """Cached release with given tag, including its notes ('body')"""
+        return next((release for release in self.releases if release['tag_name'] == tag), None)
+
+
+def check_for_updates(endpoint: str = GITHUB_API_URL, interval_hours: float = UPDATE_INTERVAL_HOURS,
+                      timeout: float = UPDATE_TIMEOUT) -> Optional[str]:
+    """
+    Check latest version, asking the server only if the cache is older
+    than interval_hours.
+
+    Args:
+        endpoint (str): Releases API URL
+        interval_hours (float): How long cached releases are used without a request
+        timeout (float): Socket timeout in seconds
+
+    Returns:
+        str | None: New version number if available, None if not
+    """
+    cache = ReleaseCache()
+    try:
+        if not cache.is_fresh(endpoint, interval_hours):
+            cache.refresh(endpoint, timeout)
     except Exception as e:
+        # The last known release list is still good for a decision
         logger.error(f"Failed to check for updates: {e}")
-        return None
 
-
-class VersionLabel(ctk.CTkFrame):
-    """Version label component with update notification"""
-
-    def __init__(self, master, config):
-        super().__init__(master, fg_color="transparent")
-        self.config = config
-
-        # Version label
-        self.version_text = ctk.CTkLabel(
-            self,
-            text=f"v{CURRENT_VERSION}",
-            font=("Roboto", 11),
-            text_color=Colors.TEXT_SECONDARY
-        )
-        self.version_text.pack(side="left", padx=2)
-
-        # Hidden update button
-        self.update_button = ctk.CTkButton(
-            self,
-            text=_("New version available!"),
-            command=self._open_release_page,
-            font=("Roboto", 11),
-            height=24,
-            fg_color=Colors.SUCCESS,
-            hover_color="#1a7f37"  # Darker shade of green
-        )
-
-        # Position at bottom center
-        self.place(relx=0.5, rely=1.0, y=-10, anchor="s")
-
-    def check_updates(self):
-        """Check for updates if enough time has passed"""
-        last_check = self.config.get_last_update_check()
-
-        if (not last_check or
-                datetime.fromisoformat(last_check) < datetime.now() - timedelta(days=1)):
-            logger.debug("Checking for updates")
-            new_version = check_for_updates()
-            if new_version:
-                logger.info(f"New version found: {new_version}")
-                self.show_update_button(new_version)
-
-            self.config.set_last_update_check(datetime.now().isoformat())
-
-    def show_update_button(self, new_version: str):
-        """Show update button"""
-        logger.debug(f"Showing update button for version {new_version}")
-        self.version_text.pack_forget()
-        self.update_button.configure(
-            text=_("Update to {version} available!").format(version=new_version)
-        )
-        self.update_button.pack(padx=2)
-
-    def _open_release_page(self):
-        """Open releases page"""
-        logger.debug(f"Opening release page: {GITHUB_RELEASE_URL}")
-        webbrowser.open(GITHUB_RELEASE_URL)
\ No newline at end of file
+    if cache.endpoint != endpoint:
+        return None
+    update = cache.find_update()
+    return update['tag_name'] if update else None
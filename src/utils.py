@@ -20,12 +20,12 @@ def get_asset_path(relative_path):
         str: Full path to the asset
     """
     if getattr(sys, 'frozen', False):
-        logger.debug(f"Running in exe mode. Base path: {sys._MEIPASS}")
+        logger.debug("Running in exe mode. Base path: %s", sys._MEIPASS)
         base_path = sys._MEIPASS
     else:
         logger.debug("Running in dev mode")
         base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
     full_path = os.path.join(base_path, relative_path)
-    logger.debug(f"Asset path resolved: {full_path}")
+    logger.debug("Asset path resolved: %s", full_path)
     return full_path
@@ -0,0 +1,17 @@
+"""
+tests/conftest.py - Shared test setup
+
+Config, logs and caches are read from HOME when src is imported, so tests
+run under a temporary HOME and never touch the real installation.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_home = tempfile.TemporaryDirectory(prefix="fmm_test_")
+os.environ['HOME'] = os.environ['USERPROFILE'] = _home.name
+os.environ.setdefault('FOREST_MOD_MANAGER_LOG_LEVEL', 'WARNING')
+sys.path.insert(0, str(PROJECT_ROOT))
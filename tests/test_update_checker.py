@@ -0,0 +1,154 @@
+"""
+tests/test_update_checker.py - Release cache against a local HTTP server
+
+The server answers like the GitHub releases API: 200 with an ETag, then
+304 Not Modified for requests sending that ETag back, until it is stopped
+to simulate being offline.
+"""
+import json
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src import update_checker
+from src.config import CURRENT_VERSION
+from src.update_checker import ReleaseCache, check_for_updates, parse_version
+
+ETAG = '"releases-v1"'
+NEW_VERSION = "v{}.0.0".format(parse_version(CURRENT_VERSION)[0] + 1)
+RELEASES = [
+    {'tag_name': NEW_VERSION, 'name': "New", 'prerelease': False, 'body': "Notes",
+     'html_url': "https://example.invalid/new", 'published_at': "2026-01-01T00:00:00Z",
+     'assets': ["dropped from the cache"]},
+    {'tag_name': "v999.0.0", 'name': "Beta", 'prerelease': True, 'body': "",
+     'html_url': "https://example.invalid/beta", 'published_at': "2026-01-02T00:00:00Z"}
+]
+
+
+class ReleasesServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), ReleasesHandler)
+        self.requests = []  # Headers of every request
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def url(self, path="/releases") -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self.thread.join()
+
+
+class ReleasesHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(RELEASES).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ReleasesServer()
+    server.thread.start()
+    yield server
+    if server.thread.is_alive():
+        server.stop()
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "update_cache.json"
+    monkeypatch.setattr(update_checker, 'ReleaseCache', partial(ReleaseCache, path))
+    return path
+
+
+def test_refresh_downloads_then_revalidates(server, cache_path):
+    cache = ReleaseCache(cache_path)
+    cache.refresh(server.url())
+
+    assert cache.etag == ETAG
+    assert cache.endpoint == server.url()
+    assert [r['tag_name'] for r in cache.releases] == [NEW_VERSION, "v999.0.0"]
+    assert 'assets' not in cache.releases[0]
+    assert 'If-None-Match' not in server.requests[0]
+
+    # 304 keeps the cached list and only moves the check time
+    first_check = cache.checked_at
+    time.sleep(0.01)
+    cache = ReleaseCache(cache_path)
+    cache.refresh(server.url())
+
+    assert server.requests[1]['If-None-Match'] == ETAG
+    assert cache.checked_at > first_check
+    assert cache.get_release(NEW_VERSION)['body'] == "Notes"
+    assert cache.find_update()['tag_name'] == NEW_VERSION
+
+
+def test_is_fresh(server, cache_path):
+    cache = ReleaseCache(cache_path)
+    assert not cache.is_fresh(server.url(), 24)
+
+    cache.refresh(server.url())
+    assert cache.is_fresh(server.url(), 24)
+    assert not cache.is_fresh(server.url(), 0)
+
+    cache.checked_at = time.time() - 25 * 60 * 60
+    assert not cache.is_fresh(server.url(), 24)
+
+
+def test_endpoint_change_downloads_without_validators(server, cache_path):
+    cache = ReleaseCache(cache_path)
+    cache.refresh(server.url())
+
+    other = server.url("/other/releases")
+    assert not cache.is_fresh(other, 24)
+    cache.refresh(other)
+
+    assert 'If-None-Match' not in server.requests[1]
+    assert cache.endpoint == other
+
+
+def test_check_for_updates_requests_only_when_due(server, cache_path):
+    assert check_for_updates(server.url(), interval_hours=24) == NEW_VERSION
+    assert check_for_updates(server.url(), interval_hours=24) == NEW_VERSION
+    assert len(server.requests) == 1
+
+    assert check_for_updates(server.url(), interval_hours=0) == NEW_VERSION
+    assert len(server.requests) == 2
+    assert server.requests[1]['If-None-Match'] == ETAG
+
+
+def test_offline_uses_cached_releases(server, cache_path):
+    assert check_for_updates(server.url(), interval_hours=0) == NEW_VERSION
+    checked_at = ReleaseCache(cache_path).checked_at
+    server.stop()
+
+    with pytest.raises(Exception):
+        ReleaseCache(cache_path).refresh(server.url(), timeout=2)
+
+    # Last known releases still decide, and the failed check is not recorded
+    assert check_for_updates(server.url(), interval_hours=0, timeout=2) == NEW_VERSION
+    assert ReleaseCache(cache_path).checked_at == checked_at
+
+
+def test_offline_without_cache_for_endpoint(server, cache_path):
+    check_for_updates(server.url(), interval_hours=0)
+    server.stop()
+
+    assert check_for_updates(server.url("/other/releases"), interval_hours=0, timeout=2) is None